@@ -1,16 +1,33 @@
 """HMAC-SHA256 authentication for Onshape API."""
 
 import base64
+import functools
 import hashlib
 import hmac
 import os
+import re
 import secrets
-import string
-from datetime import datetime, timezone
+import time
+from email.utils import formatdate
 from urllib.parse import urlparse, urlencode
 
 from dotenv import load_dotenv
 
+_token_hex = secrets.token_hex
+
+# (epoch second, formatted Date header); swapped as one tuple so threads never
+# see a second paired with another second's string
+_date_cache: tuple[int, str] = (0, "")
+
+# Characters urlencode leaves untouched; params made only of these need no quoting
+_UNRESERVED_RE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+
+@functools.cache
+def _ensure_env_loaded() -> None:
+    """Load .env into the environment (at most once per process)."""
+    load_dotenv()
+
 
 class OnshapeAuth:
     """Handles Onshape API authentication using HMAC-SHA256 signatures."""
@@ -28,7 +45,13 @@ class OnshapeAuth:
             secret_key: Onshape API secret key (or load from ONSHAPE_SECRET_KEY env)
             base_url: Onshape base URL (or load from ONSHAPE_BASE_URL env)
         """
-        load_dotenv()
+        # Only search for .env when a setting is neither passed nor already in the env
+        if (
+            (not access_key and "ONSHAPE_ACCESS_KEY" not in os.environ)
+            or (not secret_key and "ONSHAPE_SECRET_KEY" not in os.environ)
+            or (not base_url and "ONSHAPE_BASE_URL" not in os.environ)
+        ):
+            _ensure_env_loaded()
 
         self.access_key = access_key or os.getenv("ONSHAPE_ACCESS_KEY", "")
         self.secret_key = secret_key or os.getenv("ONSHAPE_SECRET_KEY", "")
@@ -40,14 +63,27 @@ class OnshapeAuth:
                 "ONSHAPE_SECRET_KEY environment variables or pass them directly."
             )
 
+        # Keyed HMAC template; copied per request so the key pads are derived once
+        self._secret_bytes = self.secret_key.encode("utf-8")
+        self._hmac_template = hmac.HMAC(self._secret_bytes, digestmod=hashlib.sha256)
+
     def _generate_nonce(self, length: int = 25) -> str:
         """Generate a random nonce for request signing."""
-        chars = string.ascii_lowercase + string.digits
-        return "".join(secrets.choice(chars) for _ in range(length))
+        return _token_hex((length + 1) // 2)[:length]
 
     def _get_utc_timestamp(self) -> str:
-        """Get current UTC timestamp in required format."""
-        return datetime.now(timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT")
+        """Get current UTC timestamp in required format.
+
+        Requests in the same second share one formatted string.
+        """
+        global _date_cache
+        now = int(time.time())
+        cached_second, cached_date = _date_cache
+        if now == cached_second:
+            return cached_date
+        date = formatdate(now, usegmt=True)
+        _date_cache = (now, date)
+        return date
 
     def _compute_signature(
         self,
@@ -64,25 +100,34 @@ class OnshapeAuth:
         (method + '\n' + nonce + '\n' + date + '\n' + content_type + '\n' +
          path + '\n' + query_string + '\n').lower()
         """
-        # Build the string to sign (all lowercase)
-        string_to_sign = (
-            f"{method}\n"
-            f"{nonce}\n"
-            f"{date}\n"
-            f"{content_type}\n"
-            f"{path}\n"
-            f"{query_string}\n"
-        ).lower()
-
-        # Compute HMAC-SHA256
-        signature = hmac.new(
-            self.secret_key.encode("utf-8"),
-            string_to_sign.encode("utf-8"),
-            hashlib.sha256,
-        ).digest()
+        # Build the string to sign (all lowercase) directly as bytes
+        string_to_sign = b"\n".join((
+            method.lower().encode("utf-8"),
+            nonce.lower().encode("utf-8"),
+            date.lower().encode("utf-8"),
+            content_type.lower().encode("utf-8"),
+            path.lower().encode("utf-8"),
+            query_string.lower().encode("utf-8"),
+            b"",
+        ))
+
+        # Compute HMAC-SHA256 from the pre-keyed template
+        mac = self._hmac_template.copy()
+        mac.update(string_to_sign)
 
         # Base64 encode the signature
-        return base64.b64encode(signature).decode("utf-8")
+        return base64.b64encode(mac.digest()).decode("utf-8")
+
+    @staticmethod
+    def _build_query_string(query_params: dict[str, str] | None) -> str:
+        """Build the sorted, URL-encoded query string used for signing and URLs."""
+        if not query_params:
+            return ""
+        items = sorted(query_params.items())
+        # Fast path: plain IDs and flags encode to themselves, so skip urlencode
+        if _UNRESERVED_RE.fullmatch("".join(f"{k}{v}" for k, v in items)):
+            return "&".join(f"{k}={v}" for k, v in items)
+        return urlencode(items)
 
     def get_headers(
         self,
@@ -102,15 +147,47 @@ class OnshapeAuth:
         Returns:
             Dictionary of headers including Authorization
         """
+        return self._headers_for(method, path, self._build_query_string(query_params), content_type)
+
+    def prepare(
+        self,
+        method: str,
+        path: str,
+        query_params: dict[str, str] | None = None,
+        content_type: str = "application/json",
+    ) -> tuple[dict[str, str], str]:
+        """Generate authentication headers and the full URL for an API request.
+
+        The query string is built once and shared by the signature and the URL.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            path: API path (e.g., /api/v10/documents)
+            query_params: Optional query parameters
+            content_type: Content-Type header value
+
+        Returns:
+            Tuple of (headers including Authorization, full URL)
+        """
+        query_string = self._build_query_string(query_params)
+        headers = self._headers_for(method, path, query_string, content_type)
+        url = f"{self.base_url}{path}"
+        if query_string:
+            url += "?" + query_string
+        return headers, url
+
+    def _headers_for(
+        self,
+        method: str,
+        path: str,
+        query_string: str,
+        content_type: str,
+    ) -> dict[str, str]:
+        """Generate signed headers for an already-encoded query string."""
         method = method.upper()
         nonce = self._generate_nonce()
         date = self._get_utc_timestamp()
 
-        # Build query string from params
-        query_string = ""
-        if query_params:
-            query_string = urlencode(sorted(query_params.items()))
-
         signature = self._compute_signature(
             method=method,
             path=path,
@@ -142,8 +219,9 @@ class OnshapeAuth:
             Full URL string
         """
         url = f"{self.base_url}{path}"
-        if query_params:
-            url += "?" + urlencode(sorted(query_params.items()))
+        query_string = self._build_query_string(query_params)
+        if query_string:
+            url += "?" + query_string
         return url
 
     def verify_credentials(self) -> bool:
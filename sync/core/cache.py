@@ -1,17 +1,46 @@
 """Cache management for Onshape standard library files."""
 
-import json
-from datetime import datetime, timezone
+import functools
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
-from ..models.config import CacheEntry, CacheManifest
+from .. import jsonio
+from ..models.config import CacheEntry, CacheManifest, utc_now_iso
 from .client import OnshapeClient
 
+# Parsed manifests by path, tagged with the (st_mtime_ns, st_size) they were read at
+_MANIFEST_CACHE: dict[Path, tuple[int, int, CacheManifest]] = {}
+
+
+@functools.lru_cache(maxsize=1024)
+def _cache_path(std_dir: Path, filename: str) -> Path:
+    """Join a cache directory and filename (memoized; paths are immutable)."""
+    return std_dir / filename
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_import(import_path: str) -> str:
+    """Strip the "std/" prefix from an import path."""
+    return import_path[4:] if import_path.startswith("std/") else import_path
+
+
+def _copy_manifest(manifest: CacheManifest) -> CacheManifest:
+    """Return an independent copy of a manifest (no JSON round-trip)."""
+    return CacheManifest.from_dict(manifest.to_dict())
+
 
 class CacheManager:
     """Manages the local cache of Onshape standard library files."""
 
+    # Concurrent Feature Studio fetches during update()
+    UPDATE_WORKERS = 16
+
+    # Decoded cache files kept in memory for repeated resolve_import calls
+    CONTENT_CACHE_SIZE = 256
+
     def __init__(
         self,
         std_dir: Path,
@@ -27,6 +56,10 @@ class CacheManager:
         self.manifest_path = self.std_dir / "manifest.json"
         self._client = client
         self._manifest: CacheManifest | None = None
+        # Filenames whose cache file is known to exist on disk
+        self._exists_cache: set[str] = set()
+        # filename -> (st_mtime_ns, contents), least recently used first
+        self._content_cache: OrderedDict[str, tuple[int, str]] = OrderedDict()
 
     @property
     def client(self) -> OnshapeClient:
@@ -43,23 +76,56 @@ class CacheManager:
         return self._manifest
 
     def _load_manifest(self) -> CacheManifest:
-        """Load manifest from disk or create empty one."""
-        if self.manifest_path.exists():
-            with open(self.manifest_path) as f:
-                data = json.load(f)
-            return CacheManifest.from_dict(data)
-        return CacheManifest()
-
-    def _save_manifest(self) -> None:
-        """Save manifest to disk."""
+        """Load manifest from disk or create empty one.
+
+        Manifests already parsed in this process are reused while the file's
+        mtime and size are unchanged.
+        """
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return CacheManifest()
+
+        cached = _MANIFEST_CACHE.get(self.manifest_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return _copy_manifest(cached[2])
+
+        manifest = CacheManifest.from_dict(jsonio.loads(self.manifest_path.read_bytes()))
+        _MANIFEST_CACHE[self.manifest_path] = (st.st_mtime_ns, st.st_size, _copy_manifest(manifest))
+        return manifest
+
+    def _save_manifest(self, pretty: bool = False) -> None:
+        """Save manifest to disk.
+
+        Written to a temporary sibling and atomically renamed into place. The
+        write is skipped when the manifest equals the last snapshot written to
+        (or read from) an unchanged file.
+
+        Args:
+            pretty: Write indented JSON instead of compact JSON (always writes)
+        """
+        cached = _MANIFEST_CACHE.get(self.manifest_path)
+        if not pretty and cached is not None and cached[2] == self.manifest:
+            try:
+                st = os.stat(self.manifest_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    return
+
         self.std_dir.mkdir(parents=True, exist_ok=True)
-        with open(self.manifest_path, "w") as f:
-            json.dump(self.manifest.to_dict(), f, indent=2)
-            f.write("\n")
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(jsonio.dumps(self.manifest.to_dict(), indent=pretty) + b"\n")
+        os.replace(tmp_path, self.manifest_path)
+        st = os.stat(self.manifest_path)
+        _MANIFEST_CACHE[self.manifest_path] = (
+            st.st_mtime_ns, st.st_size, _copy_manifest(self.manifest)
+        )
 
     def _get_cache_path(self, filename: str) -> Path:
         """Get the cache file path for a given filename."""
-        return self.std_dir / filename
+        return _cache_path(self.std_dir, filename)
 
     def is_cached(self, filename: str) -> bool:
         """Check if a file exists in the cache.
@@ -70,9 +136,27 @@ class CacheManager:
         Returns:
             True if file exists in cache
         """
-        cache_path = self._get_cache_path(filename)
-        in_manifest = filename in self.manifest.documents
-        return cache_path.exists() and in_manifest
+        if filename not in self.manifest.documents:
+            return False
+        if filename in self._exists_cache:
+            return True
+        if self._get_cache_path(filename).exists():
+            self._exists_cache.add(filename)
+            return True
+        return False
+
+    def invalidate_exists(self, filename: str | None = None) -> None:
+        """Forget that a cache file exists (e.g. after deleting it externally).
+
+        Args:
+            filename: File to forget, or None to forget all
+        """
+        if filename is None:
+            self._exists_cache.clear()
+            self._content_cache.clear()
+        else:
+            self._exists_cache.discard(filename)
+            self._content_cache.pop(filename, None)
 
     def get_cached(self, filename: str) -> str | None:
         """Get cached file contents without calling API.
@@ -83,11 +167,30 @@ class CacheManager:
         Returns:
             File contents if cached, None otherwise
         """
-        if not self.is_cached(filename):
+        if filename not in self.manifest.documents:
             return None
 
+        # One stat both confirms the file exists and validates the content cache
         cache_path = self._get_cache_path(filename)
-        return cache_path.read_text()
+        try:
+            mtime_ns = os.stat(cache_path).st_mtime_ns
+        except FileNotFoundError:
+            self._exists_cache.discard(filename)
+            return None
+        self._exists_cache.add(filename)
+
+        content_cache = self._content_cache
+        cached = content_cache.get(filename)
+        if cached is not None and cached[0] == mtime_ns:
+            content_cache.move_to_end(filename)
+            return cached[1]
+
+        contents = cache_path.read_bytes().decode("utf-8")
+        content_cache[filename] = (mtime_ns, contents)
+        content_cache.move_to_end(filename)
+        if len(content_cache) > self.CONTENT_CACHE_SIZE:
+            content_cache.popitem(last=False)
+        return contents
 
     def resolve_import(
         self,
@@ -110,9 +213,7 @@ class CacheManager:
             File contents or None if not available
         """
         # Normalize path - strip "std/" prefix if present
-        filename = import_path
-        if filename.startswith("std/"):
-            filename = filename[4:]
+        filename = _normalize_import(import_path)
 
         # Check cache first
         cached = self.get_cached(filename)
@@ -166,17 +267,20 @@ class CacheManager:
 
             # Cache the file
             cache_path = self._get_cache_path(filename)
-            cache_path.write_text(contents)
+            cache_path.write_bytes(contents.encode("utf-8"))
+            self._exists_cache.add(filename)
+            self._content_cache.pop(filename, None)
 
             # Update manifest
+            now = utc_now_iso()
             self.manifest.documents[filename] = CacheEntry(
                 document_id=document_id,
                 element_id=element_id,
                 microversion=microversion,
-                fetched_at=datetime.now(timezone.utc).isoformat(),
+                fetched_at=now,
                 onshape_version=self.manifest.onshape_std_version,
             )
-            self.manifest.update_timestamp()
+            self.manifest.update_timestamp(now)
             self._save_manifest()
 
             return contents
@@ -209,44 +313,74 @@ class CacheManager:
         else:
             files_to_update = list(self.manifest.documents.keys())
 
-        for fname in files_to_update:
-            entry = self.manifest.documents.get(fname)
-            if entry is None:
-                results[fname] = False
-                continue
-
-            try:
-                # Fetch current content
-                response = self.client.get_featurestudio_contents(
+        entries = {
+            fname: entry
+            for fname in files_to_update
+            if (entry := self.manifest.documents.get(fname)) is not None
+        }
+        if not entries:
+            return dict.fromkeys(files_to_update, False)
+
+        # One timestamp for every entry refreshed in this pass
+        now = utc_now_iso()
+        changed = False
+
+        # Overlap the network round-trips; results are applied below in order
+        client = self.client
+        with ThreadPoolExecutor(
+            max_workers=min(self.UPDATE_WORKERS, len(entries))
+        ) as executor:
+            futures = {
+                fname: executor.submit(
+                    client.get_featurestudio_contents,
                     document_id=entry.document_id,
                     workspace_id="main",  # Assuming main workspace for std
                     element_id=entry.element_id,
                 )
+                for fname, entry in entries.items()
+            }
 
-                current_microversion = response.get("microversion", "")
-
-                # Check if update needed
-                if not force and current_microversion == entry.microversion:
-                    print(f"{fname}: Already up to date")
-                    results[fname] = True
+            for fname in files_to_update:
+                entry = entries.get(fname)
+                if entry is None:
+                    results[fname] = False
                     continue
 
-                # Update cache
-                contents = response.get("contents", "")
-                cache_path = self._get_cache_path(fname)
-                cache_path.write_text(contents)
+                try:
+                    # Fetch current content
+                    response = futures[fname].result()
 
-                # Update manifest entry
-                entry.microversion = current_microversion
-                entry.fetched_at = datetime.now(timezone.utc).isoformat()
-                self._save_manifest()
+                    current_microversion = response.get("microversion", "")
 
-                print(f"{fname}: Updated (microversion: {current_microversion[:8]}...)")
-                results[fname] = True
+                    # Check if update needed
+                    if not force and current_microversion == entry.microversion:
+                        print(f"{fname}: Already up to date")
+                        results[fname] = True
+                        continue
 
-            except Exception as e:
-                print(f"{fname}: Failed to update - {e}")
-                results[fname] = False
+                    # Update cache
+                    contents = response.get("contents", "")
+                    cache_path = self._get_cache_path(fname)
+                    cache_path.write_bytes(contents.encode("utf-8"))
+                    self._exists_cache.add(fname)
+                    self._content_cache.pop(fname, None)
+
+                    # Update manifest entry
+                    entry.microversion = current_microversion
+                    entry.fetched_at = now
+                    changed = True
+
+                    print(f"{fname}: Updated (microversion: {current_microversion[:8]}...)")
+                    results[fname] = True
+
+                except Exception as e:
+                    print(f"{fname}: Failed to update - {e}")
+                    results[fname] = False
+
+        # Persist the manifest once for the whole batch
+        if changed:
+            self.manifest.update_timestamp(now)
+            self._save_manifest()
 
         return results
 
@@ -281,6 +415,7 @@ class CacheManager:
         document_id: str,
         element_id: str,
         microversion: str = "",
+        defer_save: bool = False,
     ) -> None:
         """Add a file entry to the manifest without fetching.
 
@@ -291,6 +426,7 @@ class CacheManager:
             document_id: Onshape document ID
             element_id: Element ID
             microversion: Optional microversion
+            defer_save: Skip writing the manifest; call flush() after a bulk seed
         """
         self.manifest.documents[filename] = CacheEntry(
             document_id=document_id,
@@ -299,4 +435,13 @@ class CacheManager:
             fetched_at="",  # Not fetched yet
             onshape_version=self.manifest.onshape_std_version,
         )
-        self._save_manifest()
+        if not defer_save:
+            self._save_manifest()
+
+    def flush(self, pretty: bool = False) -> None:
+        """Write the manifest to disk (after add_to_manifest(..., defer_save=True)).
+
+        Args:
+            pretty: Write indented JSON instead of compact JSON
+        """
+        self._save_manifest(pretty=pretty)
@@ -1,9 +1,16 @@
 """HTTP client wrapper for Onshape API."""
 
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from urllib.parse import parse_qsl, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .. import jsonio
 from .auth import OnshapeAuth
 
 
@@ -21,6 +28,21 @@ class OnshapeClient:
 
     # API version prefix
     API_VERSION = "v10"
+    API_PREFIX = f"/api/{API_VERSION}"
+
+    # Connection pool sizing (folder walks hit the same host repeatedly)
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 64
+
+    # Concurrent folder fetches per hierarchy level (must not exceed POOL_MAXSIZE)
+    FOLDER_WORKERS = 16
+
+    # Retries for transient server errors; each attempt is signed afresh
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.3
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    RETRY_METHODS = Retry.DEFAULT_ALLOWED_METHODS
+    MAX_RETRY_AFTER = 60.0  # Longest server-requested wait honored, in seconds
 
     def __init__(self, auth: OnshapeAuth | None = None) -> None:
         """Initialize client with authentication.
@@ -31,6 +53,62 @@ class OnshapeClient:
         self.auth = auth or OnshapeAuth()
         self.session = requests.Session()
 
+        # Keep-alive pool. The adapter only retries failed connections (the
+        # request was never sent); anything that reached Onshape is retried by
+        # _request, since a resend needs a new nonce and Date header
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=Retry(
+                total=self.MAX_RETRIES,
+                connect=self.MAX_RETRIES,
+                read=0,
+                status=0,
+                other=0,
+                backoff_factor=self.RETRY_BACKOFF,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Accept": "application/json",
+            "User-Agent": "onshape-sync/1.0",
+        })
+
+        # Memoized document/folder lookups, keyed by (kind, *ids)
+        self._cache: dict[tuple[str, ...], Any] = {}
+
+    def clear_cache(self, kind: str | None = None) -> None:
+        """Drop memoized document and folder lookups.
+
+        Args:
+            kind: Only drop lookups of this kind (e.g. "microversion"); all if None
+        """
+        if kind is None:
+            self._cache.clear()
+            return
+        for key in [k for k in list(self._cache) if k[0] == kind]:
+            self._cache.pop(key, None)
+
+    def invalidate(self, document_id: str) -> None:
+        """Drop memoized lookups for a document after it has been modified.
+
+        Args:
+            document_id: Document ID
+        """
+        # Snapshot the keys: concurrent pushes invalidate the same document
+        for key in [k for k in list(self._cache) if k[0] != "folder" and k[1] == document_id]:
+            self._cache.pop(key, None)
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self) -> "OnshapeClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def _request(
         self,
         method: str,
@@ -54,25 +132,41 @@ class OnshapeClient:
         Raises:
             OnshapeAPIError: On API errors
         """
-        headers = self.auth.get_headers(
-            method=method,
-            path=path,
-            query_params=query_params,
-            content_type=content_type,
-        )
-
-        url = self.auth.get_full_url(path, query_params)
+        # Encode the body once as UTF-8 bytes rather than letting requests
+        # re-serialize it (large Feature Studio pushes would be copied again)
+        body = None
+        if json_data is not None and method in ("POST", "PUT", "PATCH"):
+            body = jsonio.dumps(json_data)
 
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=json_data if method in ("POST", "PUT", "PATCH") else None,
-                timeout=30,
-            )
+            attempt = 0
+            while True:
+                # Sign every attempt: Onshape rejects reused nonces and stale dates
+                headers, url = self.auth.prepare(
+                    method=method,
+                    path=path,
+                    query_params=query_params,
+                    content_type=content_type,
+                )
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    data=body,
+                    timeout=30,
+                )
+                if (
+                    response.status_code not in self.RETRY_STATUSES
+                    or method not in self.RETRY_METHODS
+                    or attempt >= self.MAX_RETRIES
+                ):
+                    break
+                time.sleep(self._retry_delay(response, attempt))
+                attempt += 1
 
             if response.status_code >= 400:
+                # Onshape replies in UTF-8; skip requests' charset sniffing
+                response.encoding = response.encoding or "utf-8"
                 error_msg = f"API error {response.status_code}: {response.text[:500]}"
                 raise OnshapeAPIError(error_msg, response.status_code, response)
 
@@ -80,10 +174,27 @@ class OnshapeClient:
             if not response.content:
                 return {}
 
-            return response.json()  # type: ignore[no-any-return]
+            # Decode the body bytes directly (skips requests' str round-trip)
+            return jsonio.loads(response.content)  # type: ignore[no-any-return]
 
         except requests.RequestException as e:
             raise OnshapeAPIError(f"Request failed: {e}") from e
+        except ValueError as e:
+            raise OnshapeAPIError(f"Invalid JSON response: {e}", response.status_code, response) from e
+
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """Seconds to wait before retrying a response with a retryable status.
+
+        Honors a numeric Retry-After header (capped at MAX_RETRY_AFTER),
+        otherwise backs off exponentially.
+        """
+        try:
+            retry_after = float(response.headers.get("Retry-After", ""))
+        except ValueError:
+            retry_after = math.nan
+        if math.isfinite(retry_after) and retry_after >= 0:
+            return min(retry_after, self.MAX_RETRY_AFTER)
+        return float(self.RETRY_BACKOFF * (2 ** attempt))
 
     def get(
         self,
@@ -122,17 +233,21 @@ class OnshapeClient:
         Returns:
             List of element metadata dictionaries
         """
-        path = f"/api/{self.API_VERSION}/documents/d/{document_id}/w/{workspace_id}/elements"
-        query_params = {}
-        if element_type:
-            query_params["elementType"] = element_type
-
-        response = self.get(path, query_params if query_params else None)
-
-        # Response is a list at the top level
-        if isinstance(response, list):
-            return response
-        return response.get("items", [])
+        key = ("elements", document_id, workspace_id, element_type or "")
+        if key not in self._cache:
+            path = f"{self.API_PREFIX}/documents/d/{document_id}/w/{workspace_id}/elements"
+            query_params = {}
+            if element_type:
+                query_params["elementType"] = element_type
+
+            response = self.get(path, query_params if query_params else None)
+
+            # Response is a list at the top level
+            if not isinstance(response, list):
+                response = response.get("items", [])
+            self._cache[key] = response
+        # Copy so callers cannot change what later lookups return
+        return list(self._cache[key])
 
     def get_featurestudio_contents(
         self,
@@ -151,7 +266,7 @@ class OnshapeClient:
             Dictionary with 'contents' (source code) and metadata
         """
         path = (
-            f"/api/{self.API_VERSION}/featurestudios/d/{document_id}"
+            f"{self.API_PREFIX}/featurestudios/d/{document_id}"
             f"/w/{workspace_id}/e/{element_id}/featurestudiocontents"
         )
         return self.get(path)
@@ -175,10 +290,12 @@ class OnshapeClient:
             Updated metadata
         """
         path = (
-            f"/api/{self.API_VERSION}/featurestudios/d/{document_id}"
+            f"{self.API_PREFIX}/featurestudios/d/{document_id}"
             f"/w/{workspace_id}/e/{element_id}/featurestudiocontents"
         )
-        return self.post(path, json_data={"contents": contents})
+        response = self.post(path, json_data={"contents": contents})
+        self.invalidate(document_id)
+        return response
 
     def get_document_microversion(
         self,
@@ -194,9 +311,12 @@ class OnshapeClient:
         Returns:
             Microversion string
         """
-        path = f"/api/{self.API_VERSION}/documents/d/{document_id}/w/{workspace_id}"
-        response = self.get(path)
-        return response.get("microversion", "")
+        key = ("microversion", document_id, workspace_id)
+        if key not in self._cache:
+            path = f"{self.API_PREFIX}/documents/d/{document_id}/w/{workspace_id}"
+            response = self.get(path)
+            self._cache[key] = response.get("microversion", "")
+        return self._cache[key]  # type: ignore[no-any-return]
 
     def get_document_info(
         self,
@@ -210,8 +330,11 @@ class OnshapeClient:
         Returns:
             Document metadata including name, defaultWorkspace, etc.
         """
-        path = f"/api/{self.API_VERSION}/documents/d/{document_id}"
-        return self.get(path)
+        key = ("document_info", document_id)
+        if key not in self._cache:
+            path = f"{self.API_PREFIX}/documents/d/{document_id}"
+            self._cache[key] = self.get(path)
+        return dict(self._cache[key])
 
     def get_default_workspace(self, document_id: str) -> str:
         """Get the default workspace ID for a document.
@@ -241,14 +364,76 @@ class OnshapeClient:
 
         Returns:
             Dictionary with 'items' containing documents and subfolders
+            (all result pages merged)
         """
-        # Use Global Tree Nodes API to list folder contents
-        path = f"/api/{self.API_VERSION}/globaltreenodes/folder/{folder_id}"
-        response = self.get(path)
+        key = ("folder", folder_id)
+        if key not in self._cache:
+            # Use Global Tree Nodes API to list folder contents
+            path = f"{self.API_PREFIX}/globaltreenodes/folder/{folder_id}"
+
+            # The response has 'items' at the top level
+            # Each item has: id, name, resourceType (document/folder), etc.
+            response = self.get(path)
+
+            # Large folders are paginated via a 'next' URL; merge every page
+            items = list(response.get("items") or [])
+            seen_pages = set()
+            next_url = response.get("next")
+            while next_url and next_url not in seen_pages:
+                seen_pages.add(next_url)
+                parsed = urlparse(next_url)
+                page = self.get(parsed.path, dict(parse_qsl(parsed.query)) or None)
+                items.extend(page.get("items") or [])
+                next_url = page.get("next")
+
+            response["items"] = items
+            response.pop("next", None)
+            self._cache[key] = response
+        cached = self._cache[key]
+        return dict(cached, items=list(cached["items"]))
+
+    def _fetch_folder_contents_tree(
+        self,
+        folder_id: str,
+        max_depth: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Fetch the contents of a folder and its subfolders, level by level.
 
-        # The response has 'items' at the top level
-        # Each item has: id, name, resourceType (document/folder), etc.
-        return response
+        Sibling folders at each level are fetched concurrently, so each level
+        of the hierarchy costs roughly one round-trip.
+
+        Args:
+            folder_id: Root folder ID
+            max_depth: Deepest level whose subfolders are fetched (None for unlimited)
+
+        Returns:
+            Mapping of folder ID to its folder contents response
+        """
+        contents: dict[str, dict[str, Any]] = {}
+        queued = {folder_id}
+        level = [folder_id]
+        depth = 0
+
+        with ThreadPoolExecutor(max_workers=self.FOLDER_WORKERS) as executor:
+            while level:
+                fetched = executor.map(self.get_folder_contents, level)
+                for fid, folder_data in zip(level, fetched, strict=True):
+                    contents[fid] = folder_data
+
+                if max_depth is not None and depth >= max_depth:
+                    break
+
+                next_level: list[str] = []
+                for fid in level:
+                    for item in contents[fid].get("items", []):
+                        item_id = item.get("id", "")
+                        if item.get("resourceType", "") == "folder" and item_id not in queued:
+                            queued.add(item_id)
+                            next_level.append(item_id)
+                level = next_level
+                depth += 1
+
+        return contents
 
     def list_folder_documents(
         self,
@@ -267,28 +452,38 @@ class OnshapeClient:
             - name: document name
             - folder_path: path within folder hierarchy (if recursive)
         """
-        documents: list[dict[str, Any]] = []
-        self._collect_folder_documents(folder_id, documents, "", recursive)
-        return documents
+        contents = self._fetch_folder_contents_tree(folder_id, None if recursive else 0)
+        return self._collect_folder_documents(folder_id, contents, recursive)
 
     def _collect_folder_documents(
         self,
         folder_id: str,
-        documents: list[dict[str, Any]],
-        current_path: str,
+        contents: dict[str, dict[str, Any]],
         recursive: bool,
-    ) -> None:
-        """Recursively collect documents from a folder.
+    ) -> list[dict[str, Any]]:
+        """Collect documents from fetched folder contents, depth-first.
+
+        Uses an explicit stack of item iterators so documents keep the order
+        of a recursive walk without one Python frame per folder.
 
         Args:
-            folder_id: Current folder ID
-            documents: List to append documents to
-            current_path: Current path in hierarchy
-            recursive: Whether to recurse into subfolders
+            folder_id: Root folder ID
+            contents: Folder contents keyed by folder ID
+            recursive: Whether to descend into subfolders
+
+        Returns:
+            List of document metadata dictionaries
         """
-        folder_data = self.get_folder_contents(folder_id)
+        documents: list[dict[str, Any]] = []
+        stack = [(iter(contents.get(folder_id, {}).get("items", [])), "")]
+
+        while stack:
+            items, current_path = stack[-1]
+            item = next(items, None)
+            if item is None:
+                stack.pop()
+                continue
 
-        for item in folder_data.get("items", []):
             item_type = item.get("resourceType", "")
             item_name = item.get("name", "")
             item_id = item.get("id", "")
@@ -304,12 +499,10 @@ class OnshapeClient:
                 })
             elif item_type == "folder" and recursive:
                 subfolder_path = f"{current_path}/{item_name}" if current_path else item_name
-                self._collect_folder_documents(
-                    item_id,
-                    documents,
-                    subfolder_path,
-                    recursive,
-                )
+                subfolder_items = contents.get(item_id, {}).get("items", [])
+                stack.append((iter(subfolder_items), subfolder_path))
+
+        return documents
 
     def get_folder_tree(
         self,
@@ -325,51 +518,59 @@ class OnshapeClient:
         Returns:
             Tree structure with folders and documents
         """
-        return self._build_folder_tree(folder_id, 0, max_depth)
+        contents = self._fetch_folder_contents_tree(folder_id, max_depth)
+        return self._build_folder_tree(folder_id, contents, max_depth)
 
     def _build_folder_tree(
         self,
         folder_id: str,
-        current_depth: int,
+        contents: dict[str, dict[str, Any]],
         max_depth: int,
     ) -> dict[str, Any]:
-        """Recursively build folder tree.
+        """Build folder tree from fetched folder contents.
+
+        Subfolder nodes are attached to their parent when first seen and
+        filled in from an explicit stack, so child order is preserved.
 
         Args:
-            folder_id: Current folder ID
-            current_depth: Current depth in tree
-            max_depth: Maximum depth to recurse
+            folder_id: Root folder ID
+            contents: Folder contents keyed by folder ID
+            max_depth: Maximum depth to descend
 
         Returns:
             Tree node with children
         """
-        folder_data = self.get_folder_contents(folder_id)
-
-        tree: dict[str, Any] = {
+        root: dict[str, Any] = {
             "id": folder_id,
-            "name": folder_data.get("name", ""),
+            "name": contents.get(folder_id, {}).get("name", ""),
             "folders": [],
             "documents": [],
         }
-
-        for item in folder_data.get("items", []):
-            item_type = item.get("resourceType", "")
-
-            if item_type == "document":
-                tree["documents"].append({
-                    "id": item.get("id", ""),
-                    "name": item.get("name", ""),
-                })
-            elif item_type == "folder" and current_depth < max_depth:
-                subtree = self._build_folder_tree(
-                    item.get("id", ""),
-                    current_depth + 1,
-                    max_depth,
-                )
-                subtree["name"] = item.get("name", "")
-                tree["folders"].append(subtree)
-
-        return tree
+        stack = [(root, 0)]
+
+        while stack:
+            tree, current_depth = stack.pop()
+            folder_data = contents.get(tree["id"], {})
+
+            for item in folder_data.get("items", []):
+                item_type = item.get("resourceType", "")
+
+                if item_type == "document":
+                    tree["documents"].append({
+                        "id": item.get("id", ""),
+                        "name": item.get("name", ""),
+                    })
+                elif item_type == "folder" and current_depth < max_depth:
+                    subtree: dict[str, Any] = {
+                        "id": item.get("id", ""),
+                        "name": item.get("name", ""),
+                        "folders": [],
+                        "documents": [],
+                    }
+                    tree["folders"].append(subtree)
+                    stack.append((subtree, current_depth + 1))
+
+        return root
 
     # -------------------------------------------------------------------------
     # Standard Library Operations
@@ -402,6 +603,6 @@ class OnshapeClient:
             OnshapeAPIError: On connection or auth failure
         """
         # Use a lightweight endpoint to test authentication
-        path = f"/api/{self.API_VERSION}/users/sessioninfo"
+        path = f"{self.API_PREFIX}/users/sessioninfo"
         response = self.get(path)
         return "id" in response or "email" in response
@@ -4,7 +4,6 @@ This module provides utilities for inspecting Onshape API responses,
 saving them for documentation, and comparing responses.
 """
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -15,11 +14,41 @@ from rich.panel import Panel
 from rich.syntax import Syntax
 from rich.table import Table
 
+from .. import jsonio
 from .client import OnshapeClient, OnshapeAPIError
 
 
 console = Console()
 
+# Largest JSON text syntax-highlighted on a terminal; Pygments tokenizing is O(n)
+_MAX_HIGHLIGHT_CHARS = 64 * 1024
+
+# Common response fields shown as key metadata, in display order
+_KEY_FIELDS = (
+    "id",
+    "name",
+    "documentId",
+    "workspaceId",
+    "elementId",
+    "folderId",
+    "microversion",
+    "modifiedAt",
+    "createdAt",
+    "type",
+)
+
+# Shared client for calls that don't pass one, so repeated inspections reuse
+# its pooled connections
+_default_client: OnshapeClient | None = None
+
+
+def _get_default_client() -> OnshapeClient:
+    """Get or create the module's shared OnshapeClient."""
+    global _default_client
+    if _default_client is None:
+        _default_client = OnshapeClient()
+    return _default_client
+
 
 def see_response(
     endpoint: str,
@@ -35,7 +64,7 @@ def see_response(
         method: HTTP method (GET, POST, etc.)
         params: Query parameters or request body
         save_to: Optional path to save response
-        client: Optional OnshapeClient instance (creates new if None)
+        client: Optional OnshapeClient instance (shared default if None)
 
     Returns:
         Response data as dictionary
@@ -44,13 +73,13 @@ def see_response(
         OnshapeAPIError: If API call fails
     """
     if client is None:
-        client = OnshapeClient()
+        client = _get_default_client()
 
     console.print(f"\n[bold blue]Making {method} request to:[/bold blue] {endpoint}")
 
     if params:
         console.print("\n[bold]Parameters:[/bold]")
-        console.print(JSON(json.dumps(params)))
+        console.print(JSON(jsonio.dumps(params).decode("utf-8")))
 
     try:
         # Make the API call using the client's request method
@@ -76,6 +105,23 @@ def see_response(
         raise
 
 
+def _metadata_table() -> Table:
+    """Create the two-column table used for key metadata."""
+    table = Table(show_header=False, box=None)
+    table.add_column("Field", style="cyan")
+    table.add_column("Value", style="green")
+    return table
+
+
+def _compare_table() -> Table:
+    """Create the three-column table used for metadata comparison."""
+    table = Table()
+    table.add_column("Field")
+    table.add_column("File 1", style="green")
+    table.add_column("File 2", style="blue")
+    return table
+
+
 def _display_response(data: dict[str, Any], endpoint: str) -> None:
     """Display formatted response data."""
     # Extract key metadata if present
@@ -83,9 +129,7 @@ def _display_response(data: dict[str, Any], endpoint: str) -> None:
 
     if metadata:
         console.print("\n[bold]Key Metadata:[/bold]")
-        table = Table(show_header=False, box=None)
-        table.add_column("Field", style="cyan")
-        table.add_column("Value", style="green")
+        table = _metadata_table()
 
         for key, value in metadata.items():
             table.add_row(key, str(value))
@@ -94,34 +138,20 @@ def _display_response(data: dict[str, Any], endpoint: str) -> None:
 
     # Display full JSON
     console.print("\n[bold]Full Response:[/bold]")
-    json_str = json.dumps(data, indent=2)
+    json_str = jsonio.dumps(data, indent=True).decode("utf-8")
+    if not console.is_terminal:
+        # Redirected output: write the JSON as-is, skipping highlighting and the panel
+        console.out(json_str, highlight=False)
+        return
+    if len(json_str) > _MAX_HIGHLIGHT_CHARS:
+        json_str = json_str[:_MAX_HIGHLIGHT_CHARS] + "\n... (truncated)"
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
     console.print(Panel(syntax, title="JSON Response", expand=False))
 
 
 def _extract_metadata(data: dict[str, Any]) -> dict[str, Any]:
     """Extract key metadata fields from response."""
-    metadata: dict[str, Any] = {}
-
-    # Common fields to extract
-    key_fields = [
-        "id",
-        "name",
-        "documentId",
-        "workspaceId",
-        "elementId",
-        "folderId",
-        "microversion",
-        "modifiedAt",
-        "createdAt",
-        "type",
-    ]
-
-    for field in key_fields:
-        if field in data:
-            metadata[field] = data[field]
-
-    return metadata
+    return {field: data[field] for field in _KEY_FIELDS if field in data}
 
 
 def save_response(
@@ -153,17 +183,13 @@ def save_response(
         "response": response,
     }
 
-    if format.lower() == "json":
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2)
-    elif format.lower() == "yaml":
+    if format.lower() == "yaml":
         import yaml
         with open(path, "w", encoding="utf-8") as f:
             yaml.dump(output, f, default_flow_style=False)
     else:
-        # Raw text format
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(json.dumps(output, indent=2))
+        # json and raw text formats both hold the indented JSON, encoded once
+        path.write_bytes(jsonio.dumps(output, indent=True))
 
 
 def compare_responses(file1: str, file2: str) -> None:
@@ -184,11 +210,9 @@ def compare_responses(file1: str, file2: str) -> None:
         console.print(f"[red]File not found:[/red] {file2}")
         return
 
-    with open(path1, "r", encoding="utf-8") as f:
-        data1 = json.load(f)
-
-    with open(path2, "r", encoding="utf-8") as f:
-        data2 = json.load(f)
+    # Decode the raw bytes, so no text-mode file wrapper is needed
+    data1 = jsonio.loads(path1.read_bytes())
+    data2 = jsonio.loads(path2.read_bytes())
 
     console.print(f"\n[bold]Comparing:[/bold]")
     console.print(f"  File 1: {file1}")
@@ -200,10 +224,7 @@ def compare_responses(file1: str, file2: str) -> None:
 
     if meta1 or meta2:
         console.print("\n[bold cyan]Metadata Comparison:[/bold cyan]")
-        table = Table()
-        table.add_column("Field")
-        table.add_column("File 1", style="green")
-        table.add_column("File 2", style="blue")
+        table = _compare_table()
 
         all_keys = set(meta1.keys()) | set(meta2.keys())
         for key in sorted(all_keys):
@@ -227,38 +248,60 @@ def compare_responses(file1: str, file2: str) -> None:
         console.print("\n[bold green]No differences found![/bold green]")
 
 
+def _equal(a: Any, b: Any) -> bool:
+    """Compare with ==, treating structures too deep for it as unequal."""
+    try:
+        return bool(a == b)
+    except RecursionError:
+        return False
+
+
 def _find_differences(
     obj1: Any,
     obj2: Any,
     path: str = "root",
 ) -> list[str]:
-    """Recursively find differences between two objects."""
+    """Find differences between two objects (depth-first, without recursion).
+
+    Subtrees that compare equal are skipped with one C-level ``==``, so values
+    of different numeric types nested inside them (1 vs 1.0) are not reported.
+    """
     differences: list[str] = []
+    stack: list[tuple[Any, Any, str]] = [(obj1, obj2, path)]
 
-    if type(obj1) != type(obj2):
-        differences.append(f"{path}: Type mismatch ({type(obj1).__name__} vs {type(obj2).__name__})")
-        return differences
+    while stack:
+        a, b, path = stack.pop()
+        t1 = type(a)
+        t2 = type(b)
 
-    if isinstance(obj1, dict):
-        all_keys = set(obj1.keys()) | set(obj2.keys())
-        for key in all_keys:
-            if key not in obj1:
-                differences.append(f"{path}.{key}: Only in second object")
-            elif key not in obj2:
+        if t1 is not t2:
+            differences.append(f"{path}: Type mismatch ({t1.__name__} vs {t2.__name__})")
+
+        elif a is b or _equal(a, b):
+            continue
+
+        elif isinstance(a, dict):
+            k1 = a.keys()
+            k2 = b.keys()
+            for key in k1 - k2:
                 differences.append(f"{path}.{key}: Only in first object")
+            for key in k2 - k1:
+                differences.append(f"{path}.{key}: Only in second object")
+            # Reversed so children pop off the stack in iteration order
+            stack.extend(
+                (a[key], b[key], f"{path}.{key}") for key in reversed(list(k1 & k2))
+            )
+
+        elif isinstance(a, list):
+            if len(a) != len(b):
+                differences.append(f"{path}: List length mismatch ({len(a)} vs {len(b)})")
             else:
-                differences.extend(_find_differences(obj1[key], obj2[key], f"{path}.{key}"))
+                stack.extend(
+                    (a[i], b[i], f"{path}[{i}]") for i in range(len(a) - 1, -1, -1)
+                )
 
-    elif isinstance(obj1, list):
-        if len(obj1) != len(obj2):
-            differences.append(f"{path}: List length mismatch ({len(obj1)} vs {len(obj2)})")
         else:
-            for i, (item1, item2) in enumerate(zip(obj1, obj2)):
-                differences.extend(_find_differences(item1, item2, f"{path}[{i}]"))
-
-    else:
-        if obj1 != obj2:
-            differences.append(f"{path}: {obj1} != {obj2}")
+            differences.append(f"{path}: {a} != {b}")
 
     return differences
 
@@ -275,7 +318,7 @@ def inspect_document(doc_id: str, ws_id: str | None = None, client: OnshapeClien
         Document data
     """
     if client is None:
-        client = OnshapeClient()
+        client = _get_default_client()
 
     endpoint = f"/api/v10/documents/d/{doc_id}"
     if ws_id:
@@ -295,7 +338,7 @@ def inspect_folder(folder_id: str, client: OnshapeClient | None = None) -> dict[
         Folder data
     """
     if client is None:
-        client = OnshapeClient()
+        client = _get_default_client()
 
     endpoint = f"/api/v10/globaltreenodes/folder/{folder_id}"
     return see_response(endpoint, client=client)
@@ -314,7 +357,7 @@ def inspect_element(doc_id: str, ws_id: str, elem_id: str, client: OnshapeClient
         Element data
     """
     if client is None:
-        client = OnshapeClient()
+        client = _get_default_client()
 
     endpoint = f"/api/v10/featurestudios/d/{doc_id}/w/{ws_id}/e/{elem_id}"
     return see_response(endpoint, client=client)
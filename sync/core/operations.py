@@ -1,18 +1,23 @@
 """Pull and push sync operations."""
 
-import json
+import contextlib
+import os
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .. import jsonio
 from ..models.config import (
     DocumentConfig,
     DocumentMetadata,
     FolderConfig,
     SyncConfig,
     sanitize_filename,
+    utc_now_iso,
 )
 from .client import OnshapeClient
 from .state import ConflictType, SyncState
@@ -35,6 +40,16 @@ class SyncOperations:
 
     METADATA_FILENAME = ".document.json"
 
+    # Concurrent Feature Studio downloads per document
+    FETCH_WORKERS = 8
+
+    # Documents pulled concurrently per folder (each uses up to FETCH_WORKERS
+    # connections, so DOCUMENT_WORKERS * FETCH_WORKERS stays within the client pool)
+    DOCUMENT_WORKERS = 4
+
+    # Concurrent Feature Studio uploads per document when settings.parallel_push is set
+    PUSH_WORKERS = 4
+
     def __init__(
         self,
         config: SyncConfig,
@@ -53,11 +68,22 @@ class SyncOperations:
         self.config = config
         self._client = client
         self.base_dir = base_dir or Path.cwd()
+        self._base_prefix = os.path.join(str(self.base_dir), "")
 
         # Initialize state manager
         state_file = self.base_dir / ".sync-state.json"
         self.state = state or SyncState(state_file)
 
+        # Timestamps shared by every file and document in the current operation
+        self._batch_iso: str | None = None
+        self._batch_stamp: str | None = None
+
+        # Local directories already created (or confirmed) by this instance
+        self._known_dirs: set[Path] = set()
+
+        # Parsed .document.json files keyed by path, with their (mtime_ns, size)
+        self._metadata_cache: dict[Path, tuple[int, int, DocumentMetadata]] = {}
+
     @property
     def client(self) -> OnshapeClient:
         """Get or create OnshapeClient."""
@@ -65,24 +91,83 @@ class SyncOperations:
             self._client = OnshapeClient()
         return self._client
 
+    def _rel(self, path: Path) -> str:
+        """Return path relative to base_dir as a string.
+
+        Strips the base_dir prefix rather than calling Path.relative_to;
+        paths outside base_dir are returned unchanged.
+        """
+        s = str(path)
+        prefix = self._base_prefix
+        return s[len(prefix):] if s.startswith(prefix) else s
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create a directory (and parents) once per instance."""
+        if directory not in self._known_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._known_dirs.add(directory)
+
+    def _start_batch(self) -> None:
+        """Take one timestamp for everything the current operation writes."""
+        now = datetime.now(timezone.utc)
+        self._batch_iso = now.isoformat()
+        # Backup names have always used local time
+        self._batch_stamp = now.astimezone().strftime("%Y%m%d_%H%M%S")
+
     def _backup_file(self, filepath: Path) -> Path | None:
         """Create backup of a file before overwriting."""
         if not self.config.settings.backup_on_pull:
             return None
 
-        if not filepath.exists():
-            return None
-
-        backup_dir = self.base_dir / self.config.settings.backup_dir
-        backup_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Mirror the file's directory under backup_dir: one batch shares a
+        # timestamp, and documents often hold studios with the same name
+        relative_dir = Path(self._rel(filepath)).parent
+        if relative_dir.is_absolute():
+            relative_dir = Path(*relative_dir.parts[1:])
+        backup_dir = self.base_dir / self.config.settings.backup_dir / relative_dir
+        timestamp = self._batch_stamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_name = f"{filepath.stem}_{timestamp}{filepath.suffix}"
         backup_path = backup_dir / backup_name
 
-        shutil.copy2(filepath, backup_path)
+        # Copy first and only investigate on failure: the common case (file and
+        # backup dir both exist) then costs no extra stat/mkdir calls
+        try:
+            shutil.copyfile(filepath, backup_path)
+        except FileNotFoundError:
+            if not filepath.exists():
+                return None
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(filepath, backup_path)
         return backup_path
 
+    def _prefetch_contents(
+        self,
+        executor: ThreadPoolExecutor,
+        document_id: str,
+        workspace_id: str,
+        element_ids: list[str],
+    ) -> dict[str, Future[dict[str, Any]]]:
+        """Submit Feature Studio content downloads to run concurrently.
+
+        Args:
+            executor: Executor to run downloads on
+            document_id: Document ID
+            workspace_id: Workspace ID
+            element_ids: Element IDs to download
+
+        Returns:
+            Mapping of element ID to its pending download
+        """
+        return {
+            element_id: executor.submit(
+                self.client.get_featurestudio_contents,
+                document_id=document_id,
+                workspace_id=workspace_id,
+                element_id=element_id,
+            )
+            for element_id in element_ids
+        }
+
     def _build_onshape_url(self, document_id: str, workspace_id: str, element_id: str = "") -> str:
         """Build a URL to an Onshape document/element."""
         base = self.config.base_url
@@ -107,24 +192,34 @@ class SyncOperations:
             document_name=document_name,
             folder_path=folder_path,
             onshape_url=self._build_onshape_url(document_id, workspace_id),
-            last_sync=datetime.now(timezone.utc).isoformat(),
+            last_sync=self._batch_iso or utc_now_iso(),
             feature_studios=feature_studios,
         )
 
         metadata_path = local_dir / self.METADATA_FILENAME
-        with open(metadata_path, "w") as f:
-            json.dump(metadata.to_dict(), f, indent=2)
-            f.write("\n")
+        metadata_path.write_bytes(jsonio.dumps(metadata.to_dict(), indent=True) + b"\n")
+        st = metadata_path.stat()
+        self._metadata_cache[metadata_path] = (st.st_mtime_ns, st.st_size, metadata)
 
     def _load_document_metadata(self, local_dir: Path) -> DocumentMetadata | None:
-        """Load .document.json metadata file if it exists."""
+        """Load .document.json metadata file if it exists.
+
+        Reuses the previously parsed metadata while the file's mtime and
+        size are unchanged. The returned object is shared; do not mutate it.
+        """
         metadata_path = local_dir / self.METADATA_FILENAME
-        if not metadata_path.exists():
+        try:
+            st = metadata_path.stat()
+            cached = self._metadata_cache.get(metadata_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                return cached[2]
+            data = jsonio.loads(metadata_path.read_bytes())
+        except FileNotFoundError:
+            self._metadata_cache.pop(metadata_path, None)
             return None
-
-        with open(metadata_path) as f:
-            data = json.load(f)
-        return DocumentMetadata.from_dict(data)
+        metadata = DocumentMetadata.from_dict(data)
+        self._metadata_cache[metadata_path] = (st.st_mtime_ns, st.st_size, metadata)
+        return metadata
 
     # =========================================================================
     # Folder-Based Sync Operations (New)
@@ -149,6 +244,7 @@ class SyncOperations:
             List of SyncResults
         """
         results: list[SyncResult] = []
+        self._start_batch()
         local_root = self.base_dir / folder_config.local_path
 
         try:
@@ -168,6 +264,10 @@ class SyncOperations:
                 ))
                 return results
 
+            # Resolve local paths up front, keeping results in document order
+            planned: list[SyncResult | tuple[str, str, str, Path]] = []
+            # Documents share a few folder paths; sanitize each one once
+            folder_dirs: dict[str, Path] = {"": local_root}
             for doc_info in documents:
                 doc_id = doc_info["id"]
                 doc_name = doc_info["name"]
@@ -176,7 +276,7 @@ class SyncOperations:
                 # Check exclude patterns
                 relative_path = f"{folder_path}/{doc_name}" if folder_path else doc_name
                 if folder_config.should_exclude(relative_path):
-                    results.append(SyncResult(
+                    planned.append(SyncResult(
                         success=True,
                         filepath=relative_path,
                         operation="pull",
@@ -186,17 +286,22 @@ class SyncOperations:
                     continue
 
                 # Build local path for this document
-                doc_folder_name = sanitize_filename(doc_name)
-                if folder_path:
+                parent_dir = folder_dirs.get(folder_path)
+                if parent_dir is None:
                     sanitized_folder_path = "/".join(
                         sanitize_filename(p) for p in folder_path.split("/")
                     )
-                    local_doc_dir = local_root / sanitized_folder_path / doc_folder_name
-                else:
-                    local_doc_dir = local_root / doc_folder_name
+                    parent_dir = folder_dirs[folder_path] = local_root / sanitized_folder_path
+                local_doc_dir = parent_dir / sanitize_filename(doc_name)
 
+                planned.append((doc_id, doc_name, folder_path, local_doc_dir))
+
+            def pull_one(item: SyncResult | tuple[str, str, str, Path]) -> list[SyncResult]:
+                if isinstance(item, SyncResult):
+                    return [item]
+                doc_id, doc_name, folder_path, local_doc_dir = item
                 # Pull this document's Feature Studios
-                doc_results = self._pull_document_to_folder(
+                return self._pull_document_to_folder(
                     document_id=doc_id,
                     document_name=doc_name,
                     folder_path=folder_path,
@@ -204,7 +309,11 @@ class SyncOperations:
                     dry_run=dry_run,
                     force=force,
                 )
-                results.extend(doc_results)
+
+            # Documents are independent, so overlap their API round-trips
+            with ThreadPoolExecutor(max_workers=self.DOCUMENT_WORKERS) as executor:
+                for doc_results in executor.map(pull_one, planned):
+                    results.extend(doc_results)
 
         except Exception as e:
             results.append(SyncResult(
@@ -213,6 +322,9 @@ class SyncOperations:
                 operation="pull",
                 message=f"Failed to list folder: {e}",
             ))
+        finally:
+            # Persist file states once for the whole folder
+            self.state.save()
 
         return results
 
@@ -257,7 +369,7 @@ class SyncOperations:
             if not elements:
                 results.append(SyncResult(
                     success=True,
-                    filepath=str(local_dir.relative_to(self.base_dir)),
+                    filepath=self._rel(local_dir),
                     operation="pull",
                     message=f"No Feature Studios in document '{document_name}'",
                     skipped=True,
@@ -269,7 +381,7 @@ class SyncOperations:
                     elem_name = element.get("name", "unnamed")
                     results.append(SyncResult(
                         success=True,
-                        filepath=f"{local_dir.relative_to(self.base_dir)}/{elem_name}.fs",
+                        filepath=f"{self._rel(local_dir)}/{elem_name}.fs",
                         operation="pull",
                         message=f"[DRY RUN] Would pull {elem_name}.fs",
                         skipped=True,
@@ -277,27 +389,37 @@ class SyncOperations:
                 return results
 
             # Create local directory
-            local_dir.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(local_dir)
 
             # Track feature studios for metadata
             feature_studios: dict[str, str] = {}
 
-            for element in elements:
-                element_id = element.get("id", "")
-                element_name = element.get("name", "unnamed")
-
-                result = self._pull_feature_studio(
-                    document_id=document_id,
-                    workspace_id=workspace_id,
-                    element_id=element_id,
-                    element_name=element_name,
-                    local_dir=local_dir,
-                    force=force,
+            with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+                # Download all contents concurrently; write files in order
+                pending = self._prefetch_contents(
+                    executor,
+                    document_id,
+                    workspace_id,
+                    [element.get("id", "") for element in elements],
                 )
-                results.append(result)
 
-                if result.success:
-                    feature_studios[element_name] = element_id
+                for element in elements:
+                    element_id = element.get("id", "")
+                    element_name = element.get("name", "unnamed")
+
+                    result = self._pull_feature_studio(
+                        document_id=document_id,
+                        workspace_id=workspace_id,
+                        element_id=element_id,
+                        element_name=element_name,
+                        local_dir=local_dir,
+                        force=force,
+                        contents_future=pending[element_id],
+                    )
+                    results.append(result)
+
+                    if result.success:
+                        feature_studios[element_name] = element_id
 
             # Save document metadata
             self._save_document_metadata(
@@ -327,6 +449,7 @@ class SyncOperations:
         element_name: str,
         local_dir: Path,
         force: bool = False,
+        contents_future: Future[dict[str, Any]] | None = None,
     ) -> SyncResult:
         """Pull a single Feature Studio to a local file.
 
@@ -337,21 +460,26 @@ class SyncOperations:
             element_name: Element name (becomes filename)
             local_dir: Directory to save file in
             force: If True, overwrite local changes
+            contents_future: Already-submitted contents download to use
+                instead of fetching here
 
         Returns:
             SyncResult
         """
         filename = sanitize_filename(element_name) + self.config.settings.file_extension
         filepath = local_dir / filename
-        relative_path = str(filepath.relative_to(self.base_dir))
+        relative_path = self._rel(filepath)
 
         try:
             # Get remote content
-            response = self.client.get_featurestudio_contents(
-                document_id=document_id,
-                workspace_id=workspace_id,
-                element_id=element_id,
-            )
+            if contents_future is not None:
+                response = contents_future.result()
+            else:
+                response = self.client.get_featurestudio_contents(
+                    document_id=document_id,
+                    workspace_id=workspace_id,
+                    element_id=element_id,
+                )
 
             remote_content = response.get("contents", "")
             remote_microversion = response.get("microversion", "")
@@ -374,11 +502,12 @@ class SyncOperations:
             # Backup if needed
             self._backup_file(filepath)
 
-            # Write file
-            filepath.write_text(remote_content)
+            # Write file as UTF-8 bytes, hashing exactly what lands on disk
+            remote_bytes = remote_content.encode("utf-8")
+            filepath.write_bytes(remote_bytes)
 
             # Update state
-            local_hash = SyncState.compute_hash(remote_content)
+            local_hash = SyncState.compute_hash_bytes(remote_bytes)
             self.state.update_file_state(
                 filepath=relative_path,
                 local_hash=local_hash,
@@ -386,8 +515,9 @@ class SyncOperations:
                 element_id=element_id,
                 document_id=document_id,
                 workspace_id=workspace_id,
+                local_path=filepath,
+                now=self._batch_iso,
             )
-            self.state.save()
 
             return SyncResult(
                 success=True,
@@ -423,6 +553,7 @@ class SyncOperations:
             List of SyncResults
         """
         results: list[SyncResult] = []
+        self._start_batch()
         local_root = self.base_dir / folder_config.local_path
 
         if not local_root.exists():
@@ -434,31 +565,63 @@ class SyncOperations:
             ))
             return results
 
-        # Find all document folders (directories with .document.json)
-        for metadata_file in local_root.rglob(self.METADATA_FILENAME):
-            doc_dir = metadata_file.parent
+        try:
+            # Find all document folders (directories with .document.json)
+            for doc_dir in self._find_document_dirs(local_root):
 
-            # Check exclude patterns
-            relative_dir = doc_dir.relative_to(local_root)
-            if folder_config.should_exclude(str(relative_dir)):
-                results.append(SyncResult(
-                    success=True,
-                    filepath=str(relative_dir),
-                    operation="push",
-                    message="Excluded by pattern",
-                    skipped=True,
-                ))
-                continue
+                # Check exclude patterns
+                relative_dir = doc_dir.relative_to(local_root)
+                if folder_config.should_exclude(str(relative_dir)):
+                    results.append(SyncResult(
+                        success=True,
+                        filepath=str(relative_dir),
+                        operation="push",
+                        message="Excluded by pattern",
+                        skipped=True,
+                    ))
+                    continue
 
-            doc_results = self._push_document_folder(
-                doc_dir=doc_dir,
-                dry_run=dry_run,
-                force=force,
-            )
-            results.extend(doc_results)
+                doc_results = self._push_document_folder(
+                    doc_dir=doc_dir,
+                    dry_run=dry_run,
+                    force=force,
+                )
+                results.extend(doc_results)
+        finally:
+            # Persist file states once for the whole folder
+            self.state.save()
 
         return results
 
+    def _find_document_dirs(self, local_root: Path) -> Iterator[Path]:
+        """Yield directories under local_root that contain document metadata.
+
+        Walks with os.walk (one scandir per directory) and prunes the backup
+        directory and hidden directories instead of matching every file. A
+        hidden directory is kept if it is itself a document (a document named
+        ".Drafts" is pulled to ".Drafts/").
+
+        Args:
+            local_root: Root of a synced folder
+
+        Yields:
+            Document directories, in sorted walk order
+        """
+        metadata_name = self.METADATA_FILENAME
+        backup_dir = os.path.normpath(self.base_dir / self.config.settings.backup_dir)
+
+        for dirpath, dirnames, filenames in os.walk(local_root):
+            dirnames[:] = sorted(
+                d for d in dirnames
+                if (
+                    not d.startswith(".")
+                    or os.path.isfile(os.path.join(dirpath, d, metadata_name))
+                )
+                and os.path.normpath(os.path.join(dirpath, d)) != backup_dir
+            )
+            if metadata_name in filenames:
+                yield Path(dirpath)
+
     def _push_document_folder(
         self,
         doc_dir: Path,
@@ -475,20 +638,18 @@ class SyncOperations:
         Returns:
             List of SyncResults
         """
-        results: list[SyncResult] = []
-
         # Load metadata
         metadata = self._load_document_metadata(doc_dir)
         if metadata is None:
-            results.append(SyncResult(
+            return [SyncResult(
                 success=False,
                 filepath=str(doc_dir),
                 operation="push",
                 message=f"No {self.METADATA_FILENAME} found - cannot push",
-            ))
-            return results
+            )]
 
-        # Find all .fs files in this directory
+        # Pair each Feature Studio file with its element ID, keeping glob order
+        planned: list[SyncResult | tuple[Path, str]] = []
         extension = self.config.settings.file_extension
         for fs_file in doc_dir.glob(f"*{extension}"):
             element_name = fs_file.stem
@@ -496,25 +657,158 @@ class SyncOperations:
             # Look up element ID from metadata
             element_id = metadata.feature_studios.get(element_name)
             if not element_id:
-                results.append(SyncResult(
+                planned.append(SyncResult(
                     success=False,
-                    filepath=str(fs_file.relative_to(self.base_dir)),
+                    filepath=self._rel(fs_file),
                     operation="push",
                     message=f"No element ID found for {element_name} - pull first",
                 ))
                 continue
+            planned.append((fs_file, element_id))
 
-            result = self._push_feature_studio(
-                filepath=fs_file,
-                document_id=metadata.document_id,
-                workspace_id=metadata.workspace_id,
-                element_id=element_id,
-                dry_run=dry_run,
-                force=force,
-            )
-            results.append(result)
+        workers = self.PUSH_WORKERS if self.config.settings.parallel_push else 1
+        return self._push_files(planned, metadata, dry_run, force, workers)
 
-        return results
+    def _push_files(
+        self,
+        planned: list[SyncResult | tuple[Path, str]],
+        metadata: DocumentMetadata,
+        dry_run: bool,
+        force: bool,
+        workers: int = 1,
+    ) -> list[SyncResult]:
+        """Push one document's changed files.
+
+        Unchanged files are skipped locally first. The document microversion
+        is then fetched once, and every remaining file is checked against
+        that pre-batch value: our own pushes advance the microversion, but
+        they are not remote changes and must not conflict with the next file.
+        Afterwards every pushed file records the microversion the batch ended at.
+
+        Args:
+            planned: SyncResults or (file, element ID) pairs, in output order
+            metadata: Metadata of the document the files belong to
+            dry_run: If True, show what would happen
+            force: If True, overwrite remote changes
+            workers: Files pushed concurrently (1 pushes them in order)
+
+        Returns:
+            List of SyncResults, in the order of planned
+        """
+        results: list[SyncResult | tuple[Path, str]] = list(planned)
+        # (index into planned, bytes and hash read by the unchanged check)
+        pending: list[tuple[int, tuple[bytes, str] | None]] = []
+        for i, item in enumerate(planned):
+            if isinstance(item, SyncResult):
+                continue
+            try:
+                local = self._read_changed(item[0], force)
+            except OSError:
+                # Unreadable files are reported by _push_feature_studio below
+                pending.append((i, None))
+                continue
+            if local is None:
+                results[i] = self._unchanged_result(item[0])
+            else:
+                pending.append((i, local))
+
+        if pending:
+            microversion: str | None = None
+            # On failure each push retries the lookup and reports the error
+            with contextlib.suppress(Exception):
+                microversion = self.client.get_document_microversion(
+                    document_id=metadata.document_id,
+                    workspace_id=metadata.workspace_id,
+                )
+
+            def push_one(entry: tuple[int, tuple[bytes, str] | None]) -> SyncResult:
+                i, local = entry
+                fs_file, element_id = planned[i]  # type: ignore[misc]
+                return self._push_feature_studio(
+                    filepath=fs_file,
+                    document_id=metadata.document_id,
+                    workspace_id=metadata.workspace_id,
+                    element_id=element_id,
+                    dry_run=dry_run,
+                    force=force,
+                    expected_microversion=microversion,
+                    local=local,
+                )
+
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                    pushed = executor.map(push_one, pending)
+                    for (i, _), result in zip(pending, pushed, strict=True):
+                        results[i] = result
+            else:
+                for entry in pending:
+                    results[entry[0]] = push_one(entry)
+
+            # Each file recorded the microversion its own update produced, and
+            # later updates moved the document on; record where the batch
+            # ended for all of them so the next push does not see a conflict
+            pushed_paths = [
+                done.filepath
+                for i, _ in pending
+                if isinstance(done := results[i], SyncResult) and done.success and not done.skipped
+            ]
+            if len(pushed_paths) > 1:
+                final_microversion: str | None = None
+                if workers > 1:
+                    # Concurrent updates finish in any order; ask Onshape
+                    with contextlib.suppress(Exception):
+                        final_microversion = self.client.get_document_microversion(
+                            document_id=metadata.document_id,
+                            workspace_id=metadata.workspace_id,
+                        )
+                elif (last_state := self.state.get_file_state(pushed_paths[-1])) is not None:
+                    final_microversion = last_state.remote_microversion
+                if final_microversion:
+                    self.state.set_remote_microversion(pushed_paths, final_microversion)
+
+        return results  # type: ignore[return-value]
+
+    def _read_changed(self, filepath: Path, force: bool = False) -> tuple[bytes, str] | None:
+        """Read filepath if it changed since the last sync.
+
+        The recorded hash is trusted while mtime and size match, so an
+        unchanged file costs one stat; a changed file is read and hashed once,
+        and the caller pushes those same bytes.
+
+        Args:
+            filepath: Local file path
+            force: If True, always read the file
+
+        Returns:
+            The file's raw bytes and their hash, or None if it is unchanged
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        previous_state = None if force else self.state.get_file_state(self._rel(filepath))
+        if previous_state is not None and previous_state.local_mtime_ns:
+            st = os.stat(filepath)
+            if (
+                st.st_mtime_ns == previous_state.local_mtime_ns
+                and st.st_size == previous_state.local_size
+            ):
+                return None
+
+        local_bytes = filepath.read_bytes()
+        local_hash = SyncState.compute_hash_bytes(local_bytes)
+        if previous_state is not None and local_hash == previous_state.local_hash:
+            return None
+        return local_bytes, local_hash
+
+    def _unchanged_result(self, filepath: Path) -> SyncResult:
+        """Return the skipped push result for a file unchanged since last sync."""
+        return SyncResult(
+            success=True,
+            filepath=self._rel(filepath),
+            operation="push",
+            message=f"Unchanged {filepath.name}",
+            skipped=True,
+        )
 
     def _push_feature_studio(
         self,
@@ -524,6 +818,8 @@ class SyncOperations:
         element_id: str,
         dry_run: bool = False,
         force: bool = False,
+        expected_microversion: str | None = None,
+        local: tuple[bytes, str] | None = None,
     ) -> SyncResult:
         """Push a single Feature Studio file to Onshape.
 
@@ -534,18 +830,31 @@ class SyncOperations:
             element_id: Element ID
             dry_run: If True, show what would happen
             force: If True, overwrite remote changes
+            expected_microversion: Known current remote microversion, if any;
+                fetched from Onshape when None
+            local: Raw bytes and hash from an earlier _read_changed, if any;
+                the file is checked and read here when None
 
         Returns:
             SyncResult
         """
-        relative_path = str(filepath.relative_to(self.base_dir))
+        relative_path = self._rel(filepath)
 
         try:
+            # Skip files unchanged since the last sync before any API call
+            if local is None:
+                local = self._read_changed(filepath, force)
+                if local is None:
+                    return self._unchanged_result(filepath)
+            local_bytes, local_hash = local
+
             # Get current remote microversion for conflict check
-            remote_microversion = self.client.get_document_microversion(
-                document_id=document_id,
-                workspace_id=workspace_id,
-            )
+            remote_microversion = expected_microversion
+            if remote_microversion is None:
+                remote_microversion = self.client.get_document_microversion(
+                    document_id=document_id,
+                    workspace_id=workspace_id,
+                )
 
             # Check for conflicts
             if not force:
@@ -559,8 +868,6 @@ class SyncOperations:
                         conflict=True,
                     )
 
-            local_content = filepath.read_text()
-
             if dry_run:
                 return SyncResult(
                     success=True,
@@ -570,6 +877,12 @@ class SyncOperations:
                     skipped=True,
                 )
 
+            # The hash is of the raw bytes (as hash_file does); push text with
+            # the same newline translation read_text() applied
+            local_content = local_bytes.decode("utf-8")
+            if "\r" in local_content:
+                local_content = local_content.replace("\r\n", "\n").replace("\r", "\n")
+
             # Push to Onshape
             response = self.client.update_featurestudio_contents(
                 document_id=document_id,
@@ -581,7 +894,6 @@ class SyncOperations:
             new_microversion = response.get("microversion", "")
 
             # Update state
-            local_hash = SyncState.compute_hash(local_content)
             self.state.update_file_state(
                 filepath=relative_path,
                 local_hash=local_hash,
@@ -589,8 +901,9 @@ class SyncOperations:
                 element_id=element_id,
                 document_id=document_id,
                 workspace_id=workspace_id,
+                local_path=filepath,
+                now=self._batch_iso,
             )
-            self.state.save()
 
             return SyncResult(
                 success=True,
@@ -619,6 +932,7 @@ class SyncOperations:
     ) -> list[SyncResult]:
         """Pull all Feature Studios from a document (legacy method)."""
         results: list[SyncResult] = []
+        self._start_batch()
         local_dir = self.base_dir / doc_config.local_path
 
         try:
@@ -628,22 +942,32 @@ class SyncOperations:
                 element_type="FEATURESTUDIO",
             )
 
-            for element in elements:
-                element_id = element.get("id", "")
-                element_name = element.get("name", "")
-
-                if not element_id or not element_name:
-                    continue
+            elements = [e for e in elements if e.get("id") and e.get("name")]
+            if elements:
+                self._ensure_dir(local_dir)
 
-                result = self._pull_feature_studio(
-                    document_id=doc_config.document_id,
-                    workspace_id=doc_config.workspace_id,
-                    element_id=element_id,
-                    element_name=element_name,
-                    local_dir=local_dir,
-                    force=force,
+            with ThreadPoolExecutor(max_workers=self.FETCH_WORKERS) as executor:
+                pending = self._prefetch_contents(
+                    executor,
+                    doc_config.document_id,
+                    doc_config.workspace_id,
+                    [element["id"] for element in elements],
                 )
-                results.append(result)
+
+                for element in elements:
+                    element_id = element["id"]
+                    element_name = element["name"]
+
+                    result = self._pull_feature_studio(
+                        document_id=doc_config.document_id,
+                        workspace_id=doc_config.workspace_id,
+                        element_id=element_id,
+                        element_name=element_name,
+                        local_dir=local_dir,
+                        force=force,
+                        contents_future=pending[element_id],
+                    )
+                    results.append(result)
 
         except Exception as e:
             results.append(SyncResult(
@@ -652,6 +976,8 @@ class SyncOperations:
                 operation="pull",
                 message=f"Failed to list elements: {e}",
             ))
+        finally:
+            self.state.save()
 
         return results
 
@@ -663,6 +989,7 @@ class SyncOperations:
     ) -> list[SyncResult]:
         """Push all local Feature Studios to a document (legacy method)."""
         results: list[SyncResult] = []
+        self._start_batch()
         local_dir = self.base_dir / doc_config.local_path
 
         if not local_dir.exists():
@@ -681,10 +1008,18 @@ class SyncOperations:
                 element_type="FEATURESTUDIO",
             )
 
-            name_to_id = {e.get("name", ""): e.get("id", "") for e in elements}
-
             extension = self.config.settings.file_extension
-            for local_file in local_dir.glob(f"*{extension}"):
+            local_files = list(local_dir.glob(f"*{extension}"))
+
+            # Only index the elements that have a local file to push
+            wanted = {f.stem for f in local_files}
+            name_to_id = {
+                name: e.get("id", "")
+                for e in elements
+                if (name := e.get("name", "")) in wanted
+            }
+
+            for local_file in local_files:
                 element_name = local_file.stem
                 element_id = name_to_id.get(element_name)
 
@@ -714,6 +1049,8 @@ class SyncOperations:
                 operation="push",
                 message=f"Failed: {e}",
             ))
+        finally:
+            self.state.save()
 
         return results
 
@@ -729,6 +1066,13 @@ class SyncOperations:
         """Pull all configured folders and documents."""
         results: list[SyncResult] = []
 
+        # A forced sync should not trust lookups memoized earlier in the
+        # process; no sync should trust an earlier remote microversion
+        if force:
+            self.client.clear_cache()
+        else:
+            self.client.clear_cache("microversion")
+
         # Pull folders (new style)
         for folder_config in self.config.folders:
             folder_results = self.pull_folder(folder_config, dry_run, force)
@@ -749,6 +1093,13 @@ class SyncOperations:
         """Push all configured folders and documents."""
         results: list[SyncResult] = []
 
+        # A forced sync should not trust lookups memoized earlier in the
+        # process; no sync should trust an earlier remote microversion
+        if force:
+            self.client.clear_cache()
+        else:
+            self.client.clear_cache("microversion")
+
         # Push folders (new style)
         for folder_config in self.config.folders:
             folder_results = self.push_folder(folder_config, dry_run, force)
@@ -5,6 +5,7 @@ corporate standards) from Onshape to local directories. Reference libraries
 are read-only and cannot be pushed back to Onshape.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -25,6 +26,9 @@ console = Console()
 class ReferenceManager:
     """Manages read-only reference libraries synced from Onshape."""
 
+    # Concurrent remote version checks in update_references
+    CHECK_WORKERS = 16
+
     def __init__(
         self,
         settings: FeatureScriptSettings,
@@ -45,6 +49,48 @@ class ReferenceManager:
         self.base_dir = base_dir
         self.client = client or OnshapeClient()
 
+        # Name index and resolved local paths of settings.references, rebuilt
+        # when references are added or removed (or the list is replaced)
+        self._indexed_refs: list[ReferenceConfig] | None = None
+        self._ref_index: dict[str, ReferenceConfig] = {}
+        self._resolved_ref_paths: list[tuple[str, Path]] | None = None
+
+        # Set when a sync updated settings that have not been saved yet
+        self._dirty = False
+
+    def _save_if_dirty(self) -> None:
+        """Save settings once if any reference sync changed them."""
+        if self._dirty:
+            self.settings.save(self.settings_path)
+            self._dirty = False
+
+    def _ensure_index(self) -> None:
+        """Rebuild the reference index if settings.references has changed."""
+        if self._indexed_refs is not self.settings.references:
+            self._indexed_refs = self.settings.references
+            self._ref_index = {ref.name: ref for ref in self._indexed_refs}
+            self._resolved_ref_paths = None
+
+    def _invalidate_index(self) -> None:
+        """Drop the reference index after references are added or removed."""
+        self._indexed_refs = None
+        self._resolved_ref_paths = None
+
+    def _get_reference(self, name: str) -> ReferenceConfig | None:
+        """Get a reference by name from the index."""
+        self._ensure_index()
+        return self._ref_index.get(name)
+
+    def _reference_paths(self) -> list[tuple[str, Path]]:
+        """Get (name, resolved local path) for every reference, resolving once."""
+        self._ensure_index()
+        if self._resolved_ref_paths is None:
+            self._resolved_ref_paths = [
+                (ref.name, (self.base_dir / ref.local_path).resolve())
+                for ref in self._ref_index.values()
+            ]
+        return self._resolved_ref_paths
+
     def add_reference(
         self,
         url: str,
@@ -71,7 +117,7 @@ class ReferenceManager:
         """
         # Parse URL
         parsed = parse_url(url)
-        url_type = parsed["type"]
+        url_type = parsed.type
 
         if url_type not in ("document", "folder"):
             raise OnshapeUrlParseError(f"Reference must be a document or folder, got: {url_type}")
@@ -92,20 +138,22 @@ class ReferenceManager:
             read_only=True,
             auto_update=auto_update,
             recursive=recursive,
-            document_id=parsed["document_id"],
-            workspace_id=parsed["workspace_id"],
-            folder_id=parsed["folder_id"],
+            document_id=parsed.document_id,
+            workspace_id=parsed.workspace_id,
+            folder_id=parsed.folder_id,
         )
 
         # Add to settings
         self.settings.add_reference(ref)
+        self._invalidate_index()
 
         # Perform initial sync
         console.print(f"\n[blue]Performing initial sync for reference:[/blue] {name}")
-        self.update_single_reference(name, force=True)
+        self._update_reference(ref, force=True)
 
-        # Save settings
+        # Save settings (including the sync time recorded above)
         self.settings.save(self.settings_path)
+        self._dirty = False
         console.print(f"[green]Reference added:[/green] {name}")
 
         return ref
@@ -130,19 +178,50 @@ class ReferenceManager:
             console.print("[yellow]No references configured")
             return results
 
-        for ref in self.settings.references:
-            # Skip if auto_update is False and not forced
-            if not ref.auto_update and not force:
-                console.print(f"[dim]Skipping {ref.name} (auto_update=false, use --force to update)[/dim]")
-                results[ref.name] = True
-                continue
-
-            try:
-                success = self._update_reference(ref, check_only=check_only)
-                results[ref.name] = success
-            except Exception as e:
-                console.print(f"[red]Failed to update {ref.name}:[/red] {e}")
-                results[ref.name] = False
+        # Check every candidate's remote version concurrently (one request
+        # each); the syncs below still run one at a time
+        candidates = [ref for ref in self.settings.references if ref.auto_update or force]
+        checks: dict[int, tuple[bool, list[str]] | Exception] = {}
+        if candidates:
+            def check(ref: ReferenceConfig) -> tuple[bool, list[str]] | Exception:
+                try:
+                    return self._check_reference(ref)
+                except Exception as e:
+                    return e
+
+            workers = min(self.CHECK_WORKERS, len(candidates))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                checked = executor.map(check, candidates)
+                checks = dict(zip(map(id, candidates), checked, strict=True))
+
+        try:
+            for ref in self.settings.references:
+                # Skip if auto_update is False and not forced
+                if not ref.auto_update and not force:
+                    console.print(
+                        f"[dim]Skipping {ref.name} (auto_update=false, use --force to update)[/dim]"
+                    )
+                    results[ref.name] = True
+                    continue
+
+                try:
+                    outcome = checks[id(ref)]
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    needs_update, messages = outcome
+                    success = self._update_reference(
+                        ref,
+                        check_only=check_only,
+                        needs_update=needs_update,
+                        check_messages=messages,
+                    )
+                    results[ref.name] = success
+                except Exception as e:
+                    console.print(f"[red]Failed to update {ref.name}:[/red] {e}")
+                    results[ref.name] = False
+        finally:
+            # One settings write for the whole run
+            self._save_if_dirty()
 
         return results
 
@@ -163,17 +242,22 @@ class ReferenceManager:
         Raises:
             ValueError: If reference not found
         """
-        ref = self.settings.get_reference(name)
+        ref = self._get_reference(name)
         if not ref:
             raise ValueError(f"Reference not found: {name}")
 
-        return self._update_reference(ref, force=force)
+        try:
+            return self._update_reference(ref, force=force)
+        finally:
+            self._save_if_dirty()
 
     def _update_reference(
         self,
         ref: ReferenceConfig,
         force: bool = False,
         check_only: bool = False,
+        needs_update: bool | None = None,
+        check_messages: list[str] | None = None,
     ) -> bool:
         """Update a reference library (internal implementation).
 
@@ -181,15 +265,20 @@ class ReferenceManager:
             ref: Reference configuration
             force: Force update without checking changes
             check_only: Only check if update needed
+            needs_update: Result of an earlier _check_reference, if any
+            check_messages: Messages from that check, printed under the heading
 
         Returns:
             True if successful
         """
         console.print(f"\n[bold blue]Checking reference:[/bold blue] {ref.name}")
+        for message in check_messages or ():
+            console.print(message)
 
         # Check if remote has changed
-        needs_update = force
-        if not force:
+        if force:
+            needs_update = True
+        elif needs_update is None:
             needs_update = self._check_needs_update(ref)
 
         if not needs_update:
@@ -206,7 +295,7 @@ class ReferenceManager:
         # Create temporary SyncConfig from ReferenceConfig
         sync_config = self._reference_to_sync_config(ref)
 
-        ops = SyncOperations(sync_config, base_dir=self.base_dir)
+        ops = SyncOperations(sync_config, client=self.client, base_dir=self.base_dir)
 
         with Progress(
             SpinnerColumn(),
@@ -224,9 +313,9 @@ class ReferenceManager:
             console.print(f"[red]Failed to sync {failed_count} files from {ref.name}")
             return False
 
-        # Update last_sync timestamp
+        # Update last_sync timestamp (saved by the caller)
         ref.update_sync_time()
-        self.settings.save(self.settings_path)
+        self._dirty = True
 
         console.print(f"[green]Successfully synced {success_count} files from {ref.name}")
         return True
@@ -240,9 +329,26 @@ class ReferenceManager:
         Returns:
             True if update needed
         """
+        needs_update, messages = self._check_reference(ref)
+        for message in messages:
+            console.print(message)
+        return needs_update
+
+    def _check_reference(self, ref: ReferenceConfig) -> tuple[bool, list[str]]:
+        """Check if a reference needs updating, without printing.
+
+        Safe to run for several references at once; the caller prints the
+        returned messages under the reference's own heading.
+
+        Args:
+            ref: Reference configuration
+
+        Returns:
+            Tuple of (True if update needed, status messages to print)
+        """
         # If never synced, needs update
         if not ref.last_sync:
-            return True
+            return True, []
 
         # For document references, check microversion
         if ref.type == "document" and ref.document_id:
@@ -252,28 +358,24 @@ class ReferenceManager:
                 cached_mv = self.settings.get_cached_microversion(ref.document_id)
 
                 if cached_mv and remote_mv != cached_mv:
-                    console.print(f"[yellow]Remote microversion changed:[/yellow] {cached_mv} → {remote_mv}")
-                    return True
+                    return True, [
+                        f"[yellow]Remote microversion changed:[/yellow] {cached_mv} → {remote_mv}"
+                    ]
 
-                return cached_mv is None  # No cached version, assume needs update
+                return cached_mv is None, []  # No cached version, assume needs update
 
             except OnshapeAPIError as e:
-                console.print(f"[yellow]Warning: Could not check remote version:[/yellow] {e}")
-                return False
+                return False, [f"[yellow]Warning: Could not check remote version:[/yellow] {e}"]
 
         # For folders, we don't have a good way to check without listing all documents
         # Default to updating if it's been more than 1 day
-        if ref.last_sync:
-            try:
-                last_sync_dt = datetime.fromisoformat(ref.last_sync)
-                age = datetime.now(timezone.utc) - last_sync_dt
-                if age.days >= 1:
-                    console.print(f"[yellow]Last sync was {age.days} day(s) ago")
-                    return True
-            except ValueError:
-                pass
+        last_sync_dt = ref.last_sync_dt
+        if last_sync_dt is not None:
+            age = datetime.now(timezone.utc) - last_sync_dt
+            if age.days >= 1:
+                return True, [f"[yellow]Last sync was {age.days} day(s) ago"]
 
-        return False
+        return False, []
 
     def _reference_to_sync_config(self, ref: ReferenceConfig) -> SyncConfig:
         """Convert ReferenceConfig to SyncConfig for use with SyncOperations.
@@ -346,12 +448,13 @@ class ReferenceManager:
         Raises:
             ValueError: If reference not found
         """
-        ref = self.settings.get_reference(name)
+        ref = self._get_reference(name)
         if not ref:
             raise ValueError(f"Reference not found: {name}")
 
         # Remove from configuration
         removed = self.settings.remove_reference(name)
+        self._invalidate_index()
 
         if removed:
             # Save settings
@@ -381,15 +484,10 @@ class ReferenceManager:
         # Check if local_path is within any reference directory
         path_obj = Path(local_path).resolve()
 
-        for ref in self.settings.references:
-            ref_path = (self.base_dir / ref.local_path).resolve()
-            try:
-                # Check if path is same or child of reference path
-                path_obj.relative_to(ref_path)
+        for ref_name, ref_path in self._reference_paths():
+            # Check if path is same or child of reference path
+            if path_obj.is_relative_to(ref_path):
                 raise ValueError(
-                    f"Cannot push to reference directory '{ref.name}' - references are read-only. "
+                    f"Cannot push to reference directory '{ref_name}' - references are read-only. "
                     f"If you need to modify these files, create a working project instead."
                 )
-            except ValueError:
-                # Not a child of this reference, continue checking
-                pass
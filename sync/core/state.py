@@ -1,12 +1,18 @@
 """Sync state tracking and conflict detection."""
 
 import hashlib
-import json
+import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from .. import jsonio
+
+# Read size for the streamed hash fallback (Python < 3.11)
+_HASH_CHUNK_SIZE = 1 << 20
+
 
 @dataclass
 class FileState:
@@ -18,20 +24,19 @@ class FileState:
     element_id: str  # Onshape element ID
     document_id: str  # Onshape document ID
     workspace_id: str  # Onshape workspace ID
+    local_mtime_ns: int = 0  # Local file mtime when local_hash was recorded
+    local_size: int = 0  # Local file size when local_hash was recorded
 
-    def to_dict(self) -> dict[str, str]:
-        """Convert to dictionary."""
-        return {
-            "local_hash": self.local_hash,
-            "remote_microversion": self.remote_microversion,
-            "last_sync": self.last_sync,
-            "element_id": self.element_id,
-            "document_id": self.document_id,
-            "workspace_id": self.workspace_id,
-        }
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Instance attributes are exactly the dataclass fields, in field order,
+        so a C-level copy of __dict__ gives the same result as listing them.
+        """
+        return self.__dict__.copy()
 
     @classmethod
-    def from_dict(cls, data: dict[str, str]) -> "FileState":
+    def from_dict(cls, data: dict[str, Any]) -> "FileState":
         """Create from dictionary."""
         return cls(
             local_hash=data.get("local_hash", ""),
@@ -40,6 +45,8 @@ class FileState:
             element_id=data.get("element_id", ""),
             document_id=data.get("document_id", ""),
             workspace_id=data.get("workspace_id", ""),
+            local_mtime_ns=data.get("local_mtime_ns", 0),
+            local_size=data.get("local_size", 0),
         )
 
 
@@ -102,41 +109,97 @@ class SyncState:
         """
         self.state_file = Path(state_file)
         self._state: SyncStateData | None = None
+        self._dirty = False
+        # Serializes loading, mutation and saving when documents sync concurrently
+        self._lock = threading.RLock()
 
     @property
     def state(self) -> SyncStateData:
         """Get or load the state data."""
         if self._state is None:
-            self._state = self._load_state()
+            with self._lock:
+                if self._state is None:
+                    self._state = self._load_state()
         return self._state
 
     def _load_state(self) -> SyncStateData:
         """Load state from disk or create empty."""
         if self.state_file.exists():
-            with open(self.state_file) as f:
-                data = json.load(f)
+            data = jsonio.loads(self.state_file.read_bytes())
             return SyncStateData.from_dict(data)
         return SyncStateData()
 
-    def save(self) -> None:
-        """Save state to disk."""
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.state_file, "w") as f:
-            json.dump(self.state.to_dict(), f, indent=2)
-            f.write("\n")
+    def save(self, pretty: bool = False) -> None:
+        """Save state to disk if it changed since the last save.
+
+        The file is written to a temporary sibling and atomically renamed into
+        place so a crash mid-write cannot leave a truncated state file.
+
+        Args:
+            pretty: Write indented JSON (also forces a write when unchanged)
+        """
+        with self._lock:
+            if not self._dirty and not pretty:
+                return
+
+            # With orjson the dataclasses are encoded directly, with no intermediate dicts
+            payload = jsonio.dumps(self.state, indent=pretty) + b"\n"
+
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.state_file.with_suffix(".json.tmp")
+            tmp_file.write_bytes(payload)
+            os.replace(tmp_file, self.state_file)
+            self._dirty = False
 
     @staticmethod
-    def compute_hash(content: str) -> str:
-        """Compute SHA-256 hash of content."""
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    def compute_hash(content: str | bytes) -> str:
+        """Compute SHA-256 hash of content (str is hashed as UTF-8)."""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        return SyncState.compute_hash_bytes(content)
 
     @staticmethod
-    def hash_file(filepath: Path) -> str | None:
-        """Compute SHA-256 hash of a file."""
-        if not filepath.exists():
+    def compute_hash_bytes(data: bytes) -> str:
+        """Compute SHA-256 hash of raw bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def hash_file(filepath: Path, previous: FileState | None = None) -> str | None:
+        """Compute SHA-256 hash of a file's raw bytes.
+
+        Args:
+            filepath: File to hash
+            previous: Last recorded state; its hash is reused without reading
+                the file if the file's mtime and size still match
+
+        Returns:
+            Hex digest, or None if the file does not exist
+        """
+        try:
+            if previous is not None and previous.local_mtime_ns:
+                st = os.stat(filepath)
+                if (
+                    st.st_mtime_ns == previous.local_mtime_ns
+                    and st.st_size == previous.local_size
+                ):
+                    return previous.local_hash
+
+            with open(filepath, "rb") as f:
+                # file_digest (3.11+) feeds OpenSSL large buffers straight from
+                # the file, letting it use SHA extensions where the CPU has them
+                if hasattr(hashlib, "file_digest"):
+                    digest: str = hashlib.file_digest(f, "sha256").hexdigest()
+                    return digest
+
+                # Python 3.10: same effect with a reused 1 MiB buffer
+                h = hashlib.sha256()
+                buf = bytearray(_HASH_CHUNK_SIZE)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    h.update(view[:n])
+                return h.hexdigest()
+        except FileNotFoundError:
             return None
-        content = filepath.read_text()
-        return SyncState.compute_hash(content)
 
     def get_file_state(self, filepath: str) -> FileState | None:
         """Get state for a specific file."""
@@ -150,20 +213,59 @@ class SyncState:
         element_id: str,
         document_id: str,
         workspace_id: str,
+        local_path: Path | None = None,
+        now: str | None = None,
     ) -> None:
-        """Update state after a successful sync operation."""
-        self.state.files[filepath] = FileState(
+        """Update state after a successful sync operation.
+
+        If local_path is given, its current mtime and size are recorded so
+        later hash_file calls can skip re-hashing an unchanged file.
+
+        Args:
+            now: ISO timestamp to record, so a batch can share one timestamp
+        """
+        local_mtime_ns = 0
+        local_size = 0
+        if local_path is not None:
+            try:
+                st = os.stat(local_path)
+                local_mtime_ns = st.st_mtime_ns
+                local_size = st.st_size
+            except FileNotFoundError:
+                pass
+
+        file_state = FileState(
             local_hash=local_hash,
             remote_microversion=remote_microversion,
-            last_sync=datetime.now(timezone.utc).isoformat(),
+            last_sync=now or datetime.now(timezone.utc).isoformat(),
             element_id=element_id,
             document_id=document_id,
             workspace_id=workspace_id,
+            local_mtime_ns=local_mtime_ns,
+            local_size=local_size,
         )
+        with self._lock:
+            self.state.files[filepath] = file_state
+            self._dirty = True
+
+    def set_remote_microversion(self, filepaths: list[str], remote_microversion: str) -> None:
+        """Record a new remote microversion for already-tracked files.
+
+        Used after pushing several files of one document, whose states each
+        hold the microversion of their own update rather than the final one.
+        """
+        with self._lock:
+            for filepath in filepaths:
+                file_state = self.state.files.get(filepath)
+                if file_state is not None and file_state.remote_microversion != remote_microversion:
+                    file_state.remote_microversion = remote_microversion
+                    self._dirty = True
 
     def remove_file_state(self, filepath: str) -> None:
         """Remove state for a deleted file."""
-        self.state.files.pop(filepath, None)
+        with self._lock:
+            if self.state.files.pop(filepath, None) is not None:
+                self._dirty = True
 
     def detect_pull_conflict(
         self,
@@ -174,9 +276,9 @@ class SyncState:
         """Detect conflicts before a pull operation.
 
         Conflict detection for PULL:
+        - If remote unchanged -> nothing to pull (local file is not hashed)
         - If remote changed AND local changed -> CONFLICT
         - If only remote changed -> safe to pull
-        - If only local changed -> warn (will overwrite)
 
         Args:
             filepath: Relative path used as key
@@ -187,7 +289,6 @@ class SyncState:
             ConflictInfo describing any detected conflict
         """
         previous_state = self.get_file_state(filepath)
-        current_hash = self.hash_file(local_path)
 
         # New file - no conflict possible
         if previous_state is None:
@@ -197,54 +298,45 @@ class SyncState:
                 message="New file, safe to pull",
             )
 
-        # Check what changed
-        local_changed = current_hash != previous_state.local_hash
-        remote_changed = remote_microversion != previous_state.remote_microversion
-
-        # Local file deleted
-        if current_hash is None:
-            if remote_changed:
-                return ConflictInfo(
-                    filepath=filepath,
-                    conflict_type=ConflictType.LOCAL_DELETED,
-                    previous_hash=previous_state.local_hash,
-                    remote_microversion=remote_microversion,
-                    previous_microversion=previous_state.remote_microversion,
-                    message="Local file deleted but remote has changes",
-                )
+        # Remote unchanged - no conflict possible, skip hashing the local file
+        if remote_microversion == previous_state.remote_microversion:
             return ConflictInfo(
                 filepath=filepath,
                 conflict_type=ConflictType.NONE,
-                message="Local deleted, remote unchanged - safe to skip or restore",
+                message="Already in sync",
             )
 
-        # Both changed - conflict
-        if local_changed and remote_changed:
+        # Remote changed - check whether local changed too
+        current_hash = self.hash_file(local_path, previous_state)
+
+        # Local file deleted
+        if current_hash is None:
             return ConflictInfo(
                 filepath=filepath,
-                conflict_type=ConflictType.BOTH_CHANGED,
-                local_hash=current_hash,
+                conflict_type=ConflictType.LOCAL_DELETED,
                 previous_hash=previous_state.local_hash,
                 remote_microversion=remote_microversion,
                 previous_microversion=previous_state.remote_microversion,
-                message="Both local and remote have changes - manual resolution required",
+                message="Local file deleted but remote has changes",
             )
 
-        # Only local changed - warn but allow
-        if local_changed:
+        # Both changed - conflict
+        if current_hash != previous_state.local_hash:
             return ConflictInfo(
                 filepath=filepath,
-                conflict_type=ConflictType.NONE,
+                conflict_type=ConflictType.BOTH_CHANGED,
                 local_hash=current_hash,
                 previous_hash=previous_state.local_hash,
-                message="Warning: Local changes will be overwritten",
+                remote_microversion=remote_microversion,
+                previous_microversion=previous_state.remote_microversion,
+                message="Both local and remote have changes - manual resolution required",
             )
 
-        # Only remote changed or neither changed - safe
+        # Only remote changed - safe
         return ConflictInfo(
             filepath=filepath,
             conflict_type=ConflictType.NONE,
-            message="Safe to pull" if remote_changed else "Already in sync",
+            message="Safe to pull",
         )
 
     def detect_push_conflict(
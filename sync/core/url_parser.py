@@ -4,20 +4,54 @@ This module provides functions to parse and construct Onshape URLs,
 extracting document IDs, workspace IDs, element IDs, and folder IDs.
 """
 
+import functools
 import re
-from typing import Literal
-from urllib.parse import urlparse, parse_qs
+from typing import Literal, NamedTuple
+from urllib.parse import urlparse
 
 
 UrlType = Literal["document", "folder", "element"]
 
+# Path patterns (match alphanumeric IDs, not just hex)
+_FOLDER_RE = re.compile(r'/documents/folder/([a-zA-Z0-9_-]+)')
+_DOC_RE = re.compile(r'/documents/d/([a-zA-Z0-9_-]+)')
+_WS_RE = re.compile(r'/w/([a-zA-Z0-9_-]+)')
+_ELEM_RE = re.compile(r'/e/([a-zA-Z0-9_-]+)')
+
+# Whole canonical path in one pass: /documents/folder/ID or
+# /documents/d/ID[/w/ID[/e/ID]], optionally with a trailing slash
+_CANONICAL_RE = re.compile(
+    r'/documents/(?:folder/([a-zA-Z0-9_-]+)'
+    r'|d/([a-zA-Z0-9_-]+)(?:/w/([a-zA-Z0-9_-]+)(?:/e/([a-zA-Z0-9_-]+))?)?)/?'
+)
+
 
 class OnshapeUrlParseError(Exception):
     """Raised when URL parsing fails."""
     pass
 
 
-def parse_url(url: str) -> dict[str, str | None]:
+# A URL normalize_url would return unchanged: lowercase scheme, plain host,
+# canonical path with no trailing slash, query or fragment
+_NORMALIZED_RE = re.compile(
+    r'[a-z][a-z0-9+.-]*://[A-Za-z0-9.-]+(?::[0-9]+)?/documents/(?:folder/[a-zA-Z0-9_-]+'
+    r'|d/[a-zA-Z0-9_-]+(?:/w/[a-zA-Z0-9_-]+(?:/e/[a-zA-Z0-9_-]+)?)?)'
+)
+
+
+class ParsedOnshapeUrl(NamedTuple):
+    """Components of a parsed Onshape URL (None where not present)."""
+
+    base_url: str
+    type: UrlType
+    document_id: str | None = None
+    workspace_id: str | None = None
+    element_id: str | None = None
+    folder_id: str | None = None
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_url(url: str) -> ParsedOnshapeUrl:
     """Parse an Onshape URL into its components.
 
     Supported formats:
@@ -27,12 +61,15 @@ def parse_url(url: str) -> dict[str, str | None]:
     - https://cad.onshape.com/documents/folder/{folderId}
     - https://k2-sports.onshape.com/... (custom domain)
 
+    Results are cached per URL; ParsedOnshapeUrl is immutable, so cached
+    results are safe to share.
+
     Args:
         url: Onshape URL to parse
 
     Returns:
-        Dictionary with keys: base_url, type, document_id, workspace_id,
-        element_id, folder_id (values are None if not present)
+        ParsedOnshapeUrl with base_url, type, document_id, workspace_id,
+        element_id and folder_id
 
     Raises:
         OnshapeUrlParseError: If URL format is invalid
@@ -45,41 +82,37 @@ def parse_url(url: str) -> dict[str, str | None]:
     base_url = f"{parsed.scheme}://{parsed.netloc}"
     path = parsed.path
 
-    result: dict[str, str | None] = {
-        "base_url": base_url,
-        "type": None,
-        "document_id": None,
-        "workspace_id": None,
-        "element_id": None,
-        "folder_id": None,
-    }
-
-    # Check for folder URL (match alphanumeric IDs, not just hex)
-    folder_match = re.search(r'/documents/folder/([a-zA-Z0-9_-]+)', path)
+    # Canonical paths match in one pass; anything else is searched piecewise
+    canonical = _CANONICAL_RE.fullmatch(path)
+    if canonical:
+        folder_id, doc_id, ws_id, elem_id = canonical.groups()
+        if folder_id:
+            return ParsedOnshapeUrl(base_url, "folder", folder_id=folder_id)
+        return ParsedOnshapeUrl(
+            base_url, "element" if elem_id else "document", doc_id, ws_id, elem_id
+        )
+
+    # Check for folder URL
+    folder_match = _FOLDER_RE.search(path)
     if folder_match:
-        result["type"] = "folder"
-        result["folder_id"] = folder_match.group(1)
-        return result
+        return ParsedOnshapeUrl(base_url, "folder", folder_id=folder_match.group(1))
 
-    # Check for document URL (match alphanumeric IDs, not just hex)
-    doc_match = re.search(r'/documents/d/([a-zA-Z0-9_-]+)', path)
+    # Check for document URL
+    doc_match = _DOC_RE.search(path)
     if doc_match:
-        result["document_id"] = doc_match.group(1)
-
-        # Check for workspace (match alphanumeric IDs)
-        ws_match = re.search(r'/w/([a-zA-Z0-9_-]+)', path)
-        if ws_match:
-            result["workspace_id"] = ws_match.group(1)
+        # Check for workspace
+        ws_match = _WS_RE.search(path)
 
-        # Check for element (match alphanumeric IDs)
-        elem_match = re.search(r'/e/([a-zA-Z0-9_-]+)', path)
-        if elem_match:
-            result["element_id"] = elem_match.group(1)
-            result["type"] = "element"
-        else:
-            result["type"] = "document"
+        # Check for element
+        elem_match = _ELEM_RE.search(path)
 
-        return result
+        return ParsedOnshapeUrl(
+            base_url,
+            "element" if elem_match else "document",
+            doc_match.group(1),
+            ws_match.group(1) if ws_match else None,
+            elem_match.group(1) if elem_match else None,
+        )
 
     raise OnshapeUrlParseError(f"Unable to parse Onshape URL: {url}")
 
@@ -96,11 +129,7 @@ def get_url_type(url: str) -> UrlType:
     Raises:
         OnshapeUrlParseError: If URL format is invalid
     """
-    parsed = parse_url(url)
-    url_type = parsed.get("type")
-    if url_type not in ("document", "folder", "element"):
-        raise OnshapeUrlParseError(f"Unknown URL type: {url_type}")
-    return url_type  # type: ignore
+    return parse_url(url).type
 
 
 def build_url(
@@ -155,14 +184,14 @@ def extract_document_info(url: str) -> tuple[str, str | None]:
         OnshapeUrlParseError: If URL is not a document URL
     """
     parsed = parse_url(url)
-    if parsed["type"] not in ("document", "element"):
+    if parsed.type not in ("document", "element"):
         raise OnshapeUrlParseError(f"URL is not a document: {url}")
 
-    doc_id = parsed["document_id"]
+    doc_id = parsed.document_id
     if not doc_id:
         raise OnshapeUrlParseError(f"No document ID found in URL: {url}")
 
-    return doc_id, parsed["workspace_id"]
+    return doc_id, parsed.workspace_id
 
 
 def extract_folder_id(url: str) -> str:
@@ -178,19 +207,23 @@ def extract_folder_id(url: str) -> str:
         OnshapeUrlParseError: If URL is not a folder URL
     """
     parsed = parse_url(url)
-    if parsed["type"] != "folder":
+    if parsed.type != "folder":
         raise OnshapeUrlParseError(f"URL is not a folder: {url}")
 
-    folder_id = parsed["folder_id"]
+    folder_id = parsed.folder_id
     if not folder_id:
         raise OnshapeUrlParseError(f"No folder ID found in URL: {url}")
 
     return folder_id
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_url(url: str) -> str:
     """Normalize an Onshape URL to canonical form.
 
+    URLs already in canonical form are returned as-is without parsing, and
+    results are cached per URL.
+
     Args:
         url: Onshape URL
 
@@ -200,11 +233,15 @@ def normalize_url(url: str) -> str:
     Raises:
         OnshapeUrlParseError: If URL format is invalid
     """
+    # Stored URLs are usually canonical already
+    if _NORMALIZED_RE.fullmatch(url):
+        return url
+
     parsed = parse_url(url)
     return build_url(
-        base=parsed["base_url"] or "https://cad.onshape.com",
-        doc_id=parsed["document_id"],
-        ws_id=parsed["workspace_id"],
-        elem_id=parsed["element_id"],
-        folder_id=parsed["folder_id"],
+        base=parsed.base_url or "https://cad.onshape.com",
+        doc_id=parsed.document_id,
+        ws_id=parsed.workspace_id,
+        elem_id=parsed.element_id,
+        folder_id=parsed.folder_id,
     )
@@ -6,7 +6,7 @@ bidirectional sync support - both pull from and push to Onshape.
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
@@ -18,6 +18,9 @@ from .url_parser import parse_url, OnshapeUrlParseError
 from ..models.config import SyncConfig, FolderConfig, DocumentConfig, sanitize_filename
 from ..models.project_config import FeatureScriptSettings, ProjectConfig
 
+if TYPE_CHECKING:
+    from .references import ReferenceManager
+
 
 console = Console()
 
@@ -45,6 +48,9 @@ class WorkingDirectoryManager:
         self.base_dir = base_dir
         self.client = client or OnshapeClient()
 
+        # Created on first push and reused so its reference index persists
+        self._ref_manager: ReferenceManager | None = None
+
     def add_project(
         self,
         url: str,
@@ -71,7 +77,7 @@ class WorkingDirectoryManager:
         """
         # Parse URL
         parsed = parse_url(url)
-        url_type = parsed["type"]
+        url_type = parsed.type
 
         if url_type not in ("document", "folder"):
             raise OnshapeUrlParseError(f"Project must be a document or folder, got: {url_type}")
@@ -88,9 +94,9 @@ class WorkingDirectoryManager:
             working_directory=local_path,
             onshape_url=url,
             references=references or [],
-            document_id=parsed["document_id"],
-            workspace_id=parsed["workspace_id"],
-            folder_id=parsed["folder_id"],
+            document_id=parsed.document_id,
+            workspace_id=parsed.workspace_id,
+            folder_id=parsed.folder_id,
             recursive=True,
         )
 
@@ -142,7 +148,7 @@ class WorkingDirectoryManager:
         sync_config = self._project_to_sync_config(proj)
 
         # Create operations manager
-        ops = SyncOperations(sync_config, base_dir=self.base_dir)
+        ops = SyncOperations(sync_config, client=self.client, base_dir=self.base_dir)
 
         # Check for conflicts before pulling
         conflicts = []
@@ -241,10 +247,13 @@ class WorkingDirectoryManager:
             raise ValueError(f"Project not found: {project_name}")
 
         # Verify this is not a reference (read-only check)
-        from .references import ReferenceManager
-        ref_manager = ReferenceManager(self.settings, self.settings_path, self.base_dir, self.client)
+        if self._ref_manager is None:
+            from .references import ReferenceManager
+            self._ref_manager = ReferenceManager(
+                self.settings, self.settings_path, self.base_dir, self.client
+            )
         try:
-            ref_manager.validate_push_allowed(proj.working_directory)
+            self._ref_manager.validate_push_allowed(proj.working_directory)
         except ValueError as e:
             raise ValueError(str(e)) from e
 
@@ -257,7 +266,7 @@ class WorkingDirectoryManager:
         sync_config = self._project_to_sync_config(proj)
 
         # Create operations manager
-        ops = SyncOperations(sync_config, base_dir=self.base_dir)
+        ops = SyncOperations(sync_config, client=self.client, base_dir=self.base_dir)
 
         # Check for conflicts before pushing
         conflicts = []
@@ -354,7 +363,7 @@ class WorkingDirectoryManager:
         sync_config = self._project_to_sync_config(proj)
 
         # Create operations manager
-        ops = SyncOperations(sync_config, base_dir=self.base_dir)
+        ops = SyncOperations(sync_config, client=self.client, base_dir=self.base_dir)
 
         # Get current state
         state = ops.state
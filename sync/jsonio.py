@@ -0,0 +1,48 @@
+"""JSON encoding helpers shared by the sync system.
+
+Uses orjson when it is installed (the optional "fast" extra) and falls back to
+the standard library otherwise. Both paths write non-ASCII text as raw UTF-8
+and accept the same inputs: dict keys must be str, as orjson requires.
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    """Serialize dataclasses for the stdlib encoder (orjson handles them natively)."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode an object as UTF-8 JSON bytes.
+
+    Args:
+        obj: Object to encode (dicts with str keys, lists, scalars and dataclasses)
+        indent: Indent with two spaces instead of writing compact JSON
+
+    Returns:
+        Encoded JSON without a trailing newline
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_default).encode("utf-8")
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_default
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
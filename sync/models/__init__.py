@@ -9,6 +9,7 @@ from .config import (
     SyncConfig,
     SyncSettings,
     sanitize_filename,
+    utc_now_iso,
 )
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "SyncConfig",
     "SyncSettings",
     "sanitize_filename",
+    "utc_now_iso",
 ]
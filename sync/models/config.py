@@ -1,6 +1,8 @@
 """Configuration and data models for the sync system."""
 
 import fnmatch
+import functools
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -9,16 +11,56 @@ from typing import Any
 
 import yaml
 
+# Prefer the libyaml C loader/dumper; fall back to pure Python without libyaml
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
+
+class _ConfigDumper(_YamlDumper):  # type: ignore[misc,valid-type]
+    """Dumper with the config.yaml layout baked in: block style, field order kept."""
+
+    def __init__(self, stream: Any, **kwargs: Any) -> None:
+        kwargs["default_flow_style"] = False
+        kwargs["sort_keys"] = False
+        super().__init__(stream, **kwargs)
+
+
+# Characters that give a pattern glob meaning in fnmatch
+_GLOB_MAGIC_RE = re.compile(r'[*?\[]')
+
+# sanitize_filename: characters problematic on various filesystems -> '_'
+_INVALID_CHARS_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+_COLLAPSE_RE = re.compile(r'[_\s]+')
+
+# Keys written by SyncConfig.save, in file order
+_FOLDER_FIELDS = ("name", "folder_id", "local_path", "recursive", "exclude")
+_DOC_FIELDS = ("name", "document_id", "workspace_id", "local_path")
+_SETTINGS_FIELDS = (
+    "backup_on_pull", "backup_dir", "file_extension", "verbose", "default_workspace",
+    "parallel_push",
+)
+
+_now = datetime.now
+_UTC = timezone.utc
+
+
+def utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return _now(_UTC).isoformat()
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(name: str) -> str:
     """Sanitize a name for use as a filesystem path.
 
     Replaces invalid characters with underscores and handles edge cases.
+    Results are memoized, since document and element names repeat heavily
+    across a sync pass and the function is pure on its (hashable) str input.
     """
     # Replace characters that are problematic on various filesystems
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', name)
+    sanitized = name.translate(_INVALID_CHARS_TABLE)
     # Replace multiple underscores/spaces with single underscore
-    sanitized = re.sub(r'[_\s]+', '_', sanitized)
+    sanitized = _COLLAPSE_RE.sub('_', sanitized)
     # Remove leading/trailing underscores and spaces
     sanitized = sanitized.strip('_ ')
     # Handle empty result
@@ -34,6 +76,22 @@ class FolderConfig:
     local_path: str  # Local directory to sync to
     recursive: bool = True  # Include subfolders
     exclude: list[str] = field(default_factory=list)  # Glob patterns to exclude
+    # Exclude patterns split in __post_init__: literal names and one combined glob regex
+    _literals: frozenset[str] = field(
+        default_factory=frozenset, init=False, repr=False, compare=False
+    )
+    _glob: re.Pattern[str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        patterns = [os.path.normcase(pattern) for pattern in self.exclude]
+        # Patterns without glob magic only ever match the exact string
+        self._literals = frozenset(p for p in patterns if not _GLOB_MAGIC_RE.search(p))
+        globs = [p for p in patterns if _GLOB_MAGIC_RE.search(p)]
+        self._glob = (
+            re.compile("|".join(f"(?:{fnmatch.translate(p)})" for p in globs)) if globs else None
+        )
 
     def should_exclude(self, path: str) -> bool:
         """Check if a path matches any exclude pattern.
@@ -44,24 +102,31 @@ class FolderConfig:
         Returns:
             True if path should be excluded
         """
-        for pattern in self.exclude:
-            if fnmatch.fnmatch(path, pattern):
-                return True
-            # Also check just the name portion
-            if fnmatch.fnmatch(path.split('/')[-1], pattern):
-                return True
-        return False
+        # Also check just the name portion (split before normcase, which turns
+        # '/' into '\\' on Windows)
+        basename = os.path.normcase(path.rpartition('/')[2])
+        path = os.path.normcase(path)
+        if path in self._literals or basename in self._literals:
+            return True
+        glob = self._glob
+        return glob is not None and (
+            glob.match(path) is not None or glob.match(basename) is not None
+        )
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "FolderConfig":
         """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            folder_id=data["folder_id"],
-            local_path=data["local_path"],
-            recursive=data.get("recursive", True),
-            exclude=data.get("exclude", []),
-        )
+        _get = data.get
+        obj = object.__new__(cls)
+        obj.__dict__.update({
+            "name": data["name"],
+            "folder_id": data["folder_id"],
+            "local_path": data["local_path"],
+            "recursive": _get("recursive", True),
+            "exclude": _get("exclude", []),
+        })
+        obj.__post_init__()
+        return obj
 
 
 @dataclass
@@ -76,12 +141,14 @@ class DocumentConfig:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DocumentConfig":
         """Create from dictionary."""
-        return cls(
-            name=data["name"],
-            document_id=data["document_id"],
-            workspace_id=data["workspace_id"],
-            local_path=data["local_path"],
-        )
+        obj = object.__new__(cls)
+        obj.__dict__.update({
+            "name": data["name"],
+            "document_id": data["document_id"],
+            "workspace_id": data["workspace_id"],
+            "local_path": data["local_path"],
+        })
+        return obj
 
 
 @dataclass
@@ -101,32 +168,31 @@ class DocumentMetadata:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "document_id": self.document_id,
-            "workspace_id": self.workspace_id,
-            "document_name": self.document_name,
-            "folder_path": self.folder_path,
-            "onshape_url": self.onshape_url,
-            "last_sync": self.last_sync,
-            "feature_studios": self.feature_studios,
-        }
+        return self.__dict__.copy()
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "DocumentMetadata":
         """Create from dictionary."""
-        return cls(
-            document_id=data["document_id"],
-            workspace_id=data["workspace_id"],
-            document_name=data["document_name"],
-            folder_path=data.get("folder_path", ""),
-            onshape_url=data.get("onshape_url", ""),
-            last_sync=data.get("last_sync", ""),
-            feature_studios=data.get("feature_studios", {}),
-        )
+        _get = data.get
+        obj = object.__new__(cls)
+        obj.__dict__.update({
+            "document_id": data["document_id"],
+            "workspace_id": data["workspace_id"],
+            "document_name": data["document_name"],
+            "folder_path": _get("folder_path", ""),
+            "onshape_url": _get("onshape_url", ""),
+            "last_sync": _get("last_sync", ""),
+            "feature_studios": _get("feature_studios", {}),
+        })
+        return obj
+
+    def update_timestamp(self, now: str | None = None) -> None:
+        """Update last_sync to now.
 
-    def update_timestamp(self) -> None:
-        """Update last_sync to now."""
-        self.last_sync = datetime.now(timezone.utc).isoformat()
+        Args:
+            now: ISO timestamp to use, so a batch can share one timestamp
+        """
+        self.last_sync = now or utc_now_iso()
 
 
 @dataclass
@@ -139,6 +205,8 @@ class SyncSettings:
     verbose: bool = False
     # Default workspace to use when not specified
     default_workspace: str = "main"
+    # Push a document's changed files concurrently instead of one at a time
+    parallel_push: bool = False
 
 
 @dataclass
@@ -160,7 +228,7 @@ class SyncConfig:
     def load(cls, config_path: Path) -> "SyncConfig":
         """Load configuration from YAML file."""
         with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
 
         # Load folder configs (new style)
         folders = []
@@ -180,6 +248,7 @@ class SyncConfig:
             file_extension=settings_data.get("file_extension", ".fs"),
             verbose=settings_data.get("verbose", False),
             default_workspace=settings_data.get("default_workspace", "main"),
+            parallel_push=settings_data.get("parallel_push", False),
         )
 
         base_url = data.get("base_url", "https://cad.onshape.com")
@@ -197,39 +266,22 @@ class SyncConfig:
 
         if self.folders:
             data["folders"] = [
-                {
-                    "name": f.name,
-                    "folder_id": f.folder_id,
-                    "local_path": f.local_path,
-                    "recursive": f.recursive,
-                    "exclude": f.exclude,
-                }
-                for f in self.folders
+                {k: getattr(f, k) for k in _FOLDER_FIELDS} for f in self.folders
             ]
 
         if self.documents:
             data["documents"] = [
-                {
-                    "name": d.name,
-                    "document_id": d.document_id,
-                    "workspace_id": d.workspace_id,
-                    "local_path": d.local_path,
-                }
-                for d in self.documents
+                {k: getattr(d, k) for k in _DOC_FIELDS} for d in self.documents
             ]
 
         data["base_url"] = self.base_url
 
-        data["settings"] = {
-            "backup_on_pull": self.settings.backup_on_pull,
-            "backup_dir": self.settings.backup_dir,
-            "file_extension": self.settings.file_extension,
-            "verbose": self.settings.verbose,
-            "default_workspace": self.settings.default_workspace,
-        }
+        settings = self.settings
+        data["settings"] = {k: getattr(settings, k) for k in _SETTINGS_FIELDS}
 
-        with open(config_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        # Binary stream lets libyaml emit encoded bytes directly
+        with open(config_path, "wb") as f:
+            yaml.dump(data, f, Dumper=_ConfigDumper, encoding="utf-8")
 
 
 # ---------------------------------------------------------------------------
@@ -248,24 +300,23 @@ class CacheEntry:
 
     def to_dict(self) -> dict[str, str]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "document_id": self.document_id,
-            "element_id": self.element_id,
-            "microversion": self.microversion,
-            "fetched_at": self.fetched_at,
-            "onshape_version": self.onshape_version,
-        }
+        return self.__dict__.copy()
 
     @classmethod
     def from_dict(cls, data: dict[str, str]) -> "CacheEntry":
         """Create from dictionary."""
-        return cls(
-            document_id=data["document_id"],
-            element_id=data["element_id"],
-            microversion=data["microversion"],
-            fetched_at=data["fetched_at"],
-            onshape_version=data["onshape_version"],
-        )
+        obj = object.__new__(cls)
+        obj.__dict__.update({
+            "document_id": data["document_id"],
+            "element_id": data["element_id"],
+            "microversion": data["microversion"],
+            "fetched_at": data["fetched_at"],
+            "onshape_version": data["onshape_version"],
+        })
+        return obj
+
+
+_CACHE_ENTRY_FIELDS = frozenset(CacheEntry.__dataclass_fields__)
 
 
 @dataclass
@@ -279,30 +330,52 @@ class CacheManifest:
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
-            "version": self.version,
-            "last_updated": self.last_updated,
-            "onshape_std_version": self.onshape_std_version,
-            "documents": {k: v.to_dict() for k, v in self.documents.items()},
-        }
+        data = self.__dict__.copy()
+        # Copy each entry's attribute dict directly instead of calling to_dict per entry
+        data["documents"] = {k: v.__dict__.copy() for k, v in self.documents.items()}
+        return data
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "CacheManifest":
         """Create from dictionary."""
-        documents = {}
-        for name, entry_data in (data.get("documents") or {}).items():
-            documents[name] = CacheEntry.from_dict(entry_data)
+        _get = data.get
+        new = object.__new__
+        entry_cls = CacheEntry
 
-        return cls(
-            version=data.get("version", "1.0"),
-            last_updated=data.get("last_updated"),
-            onshape_std_version=data.get("onshape_std_version", "2878"),
-            documents=documents,
-        )
+        # Build entries inline rather than via CacheEntry.from_dict per item
+        documents = {}
+        for name, entry_data in (_get("documents") or {}).items():
+            entry = new(entry_cls)
+            if entry_data.keys() == _CACHE_ENTRY_FIELDS:
+                # Freshly parsed JSON with exactly the entry fields: adopt it as-is
+                entry.__dict__ = entry_data
+                documents[name] = entry
+                continue
+            entry.__dict__.update({
+                "document_id": entry_data["document_id"],
+                "element_id": entry_data["element_id"],
+                "microversion": entry_data["microversion"],
+                "fetched_at": entry_data["fetched_at"],
+                "onshape_version": entry_data["onshape_version"],
+            })
+            documents[name] = entry
+
+        obj = new(cls)
+        obj.__dict__.update({
+            "version": _get("version", "1.0"),
+            "last_updated": _get("last_updated"),
+            "onshape_std_version": _get("onshape_std_version", "2878"),
+            "documents": documents,
+        })
+        return obj
+
+    def update_timestamp(self, now: str | None = None) -> None:
+        """Update the last_updated timestamp to now.
 
-    def update_timestamp(self) -> None:
-        """Update the last_updated timestamp to now."""
-        self.last_updated = datetime.now(timezone.utc).isoformat()
+        Args:
+            now: ISO timestamp to use, so a batch can share one timestamp
+        """
+        self.last_updated = now or utc_now_iso()
 
 
 # ---------------------------------------------------------------------------
@@ -9,7 +9,8 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-import json
+
+from .. import jsonio
 
 
 @dataclass
@@ -63,9 +64,27 @@ class ReferenceConfig:
             folder_id=data.get("folder_id"),
         )
 
+    @property
+    def last_sync_dt(self) -> datetime | None:
+        """last_sync as a datetime, or None if unset or not ISO 8601.
+
+        Parsed once per last_sync value; the result is kept outside the
+        dataclass fields, so it is not serialized or compared.
+        """
+        cached = self.__dict__.get("_last_sync_dt")
+        if cached is None or cached[0] != self.last_sync:
+            try:
+                parsed = datetime.fromisoformat(self.last_sync) if self.last_sync else None
+            except ValueError:
+                parsed = None
+            cached = self.__dict__["_last_sync_dt"] = (self.last_sync, parsed)
+        return cached[1]
+
     def update_sync_time(self) -> None:
         """Update last_sync timestamp to now."""
-        self.last_sync = datetime.now(timezone.utc).isoformat()
+        now = datetime.now(timezone.utc)
+        self.last_sync = now.isoformat()
+        self.__dict__["_last_sync_dt"] = (self.last_sync, now)
 
 
 @dataclass
@@ -203,21 +222,18 @@ class FeatureScriptSettings:
     @classmethod
     def load(cls, path: Path) -> "FeatureScriptSettings":
         """Load configuration from JSON file."""
-        if not path.exists():
+        try:
+            data = jsonio.loads(path.read_bytes())
+        except FileNotFoundError:
             # Return default config if file doesn't exist
             return cls()
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
         return cls.from_dict(data)
 
     def save(self, path: Path) -> None:
         """Save configuration to JSON file."""
         path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        path.write_bytes(jsonio.dumps(self.to_dict(), indent=True))
 
     def get_reference(self, name: str) -> ReferenceConfig | None:
         """Get reference by name."""
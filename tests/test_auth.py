@@ -1,7 +1,11 @@
 """Tests for Onshape authentication."""
 
+import base64
+import hashlib
+import hmac
 import os
 from unittest.mock import patch
+from urllib.parse import urlencode
 
 import pytest
 
@@ -52,6 +56,50 @@ class TestOnshapeAuth:
         assert "GMT" in timestamp
         assert len(timestamp) > 20
 
+    def test_get_utc_timestamp_format(self) -> None:
+        auth = OnshapeAuth(
+            access_key="test",
+            secret_key="test",
+        )
+
+        with patch("sync.core.auth.time.time", return_value=1769860800.5):
+            assert auth._get_utc_timestamp() == "Sat, 31 Jan 2026 12:00:00 GMT"
+            assert auth._get_utc_timestamp() == "Sat, 31 Jan 2026 12:00:00 GMT"
+
+    def test_compute_signature(self) -> None:
+        auth = OnshapeAuth(
+            access_key="test",
+            secret_key="test_secret",
+        )
+
+        signature = auth._compute_signature(
+            method="GET",
+            path="/api/v10/documents",
+            query_string="a=1&b=2",
+            nonce="abc123",
+            date="Sat, 31 Jan 2026 12:00:00 GMT",
+            content_type="application/json",
+        )
+
+        expected_string = (
+            "get\nabc123\nsat, 31 jan 2026 12:00:00 gmt\napplication/json\n"
+            "/api/v10/documents\na=1&b=2\n"
+        )
+        expected = base64.b64encode(
+            hmac.new(b"test_secret", expected_string.encode("utf-8"), hashlib.sha256).digest()
+        ).decode("utf-8")
+        assert signature == expected
+
+        # Repeated calls reuse the keyed template without mutating it
+        assert signature == auth._compute_signature(
+            method="GET",
+            path="/api/v10/documents",
+            query_string="a=1&b=2",
+            nonce="abc123",
+            date="Sat, 31 Jan 2026 12:00:00 GMT",
+            content_type="application/json",
+        )
+
     def test_get_headers(self) -> None:
         auth = OnshapeAuth(
             access_key="test_key",
@@ -69,6 +117,26 @@ class TestOnshapeAuth:
         assert "On-Nonce" in headers
         assert headers["Content-Type"] == "application/json"
 
+    def test_prepare(self) -> None:
+        auth = OnshapeAuth(
+            access_key="test_key",
+            secret_key="test_secret",
+            base_url="https://cad.onshape.com",
+        )
+
+        headers, url = auth.prepare(
+            method="GET",
+            path="/api/v10/documents",
+            query_params={"foo": "bar", "baz": "qux"},
+        )
+
+        assert headers["Authorization"].startswith("On test_key:HmacSHA256:")
+        assert url == auth.get_full_url(
+            "/api/v10/documents",
+            query_params={"foo": "bar", "baz": "qux"},
+        )
+        assert url == "https://cad.onshape.com/api/v10/documents?baz=qux&foo=bar"
+
     def test_get_full_url(self) -> None:
         auth = OnshapeAuth(
             access_key="test",
@@ -86,6 +154,14 @@ class TestOnshapeAuth:
         assert "foo=bar" in url_with_params
         assert "baz=qux" in url_with_params
 
+    def test_build_query_string_matches_urlencode(self) -> None:
+        for params in (
+            {"foo": "bar", "baz": "qux"},
+            {"limit": 20, "includeFiles": True, "id": "a1_b-2.c~3"},
+            {"q": "two words", "path": "a/b&c=d", "name": "caf\u00e9"},
+        ):
+            assert OnshapeAuth._build_query_string(params) == urlencode(sorted(params.items()))
+
     def test_verify_credentials(self) -> None:
         auth = OnshapeAuth(
             access_key="test",
@@ -0,0 +1,130 @@
+"""Tests for the standard library cache manager."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from sync.core import cache as cache_module
+from sync.core.cache import CacheManager
+
+
+class TestManifestCache:
+    """Tests for in-process manifest reuse."""
+
+    def test_reload_reuses_parsed_manifest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        manager = CacheManager(tmp_path)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("manifest was parsed again")
+
+        monkeypatch.setattr(cache_module.jsonio, "loads", fail)
+        reloaded = CacheManager(tmp_path).manifest
+
+        assert reloaded.documents["geometry.fs"].microversion == "mv1"
+        # Callers get their own copy, not the cached instance
+        reloaded.documents["geometry.fs"].microversion = "changed"
+        assert CacheManager(tmp_path).manifest.documents["geometry.fs"].microversion == "mv1"
+
+    def test_external_change_is_reloaded(self, tmp_path: Path) -> None:
+        manager = CacheManager(tmp_path)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(manifest_path.read_text().replace("mv1", "mv2-longer"))
+
+        assert CacheManager(tmp_path).manifest.documents["geometry.fs"].microversion == "mv2-longer"
+
+    def test_save_skipped_when_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = CacheManager(tmp_path)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+
+        def fail(*args: object, **kwargs: object) -> None:
+            raise AssertionError("manifest was written again")
+
+        monkeypatch.setattr(cache_module.jsonio, "dumps", fail)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+        CacheManager(tmp_path).flush()
+
+        with pytest.raises(AssertionError):
+            manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv2")
+
+
+class TestIsCached:
+    """Tests for CacheManager.is_cached."""
+
+    def test_is_cached_remembers_existing_files(self, tmp_path: Path) -> None:
+        manager = CacheManager(tmp_path)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+        assert not manager.is_cached("geometry.fs")
+
+        (tmp_path / "geometry.fs").write_text("contents")
+        assert manager.is_cached("geometry.fs")
+
+        (tmp_path / "geometry.fs").unlink()
+        assert manager.is_cached("geometry.fs")
+        manager.invalidate_exists("geometry.fs")
+        assert not manager.is_cached("geometry.fs")
+
+
+class TestGetCached:
+    """Tests for CacheManager.get_cached."""
+
+    def test_contents_reused_until_file_changes(self, tmp_path: Path) -> None:
+        manager = CacheManager(tmp_path)
+        manager.add_to_manifest("geometry.fs", "doc1", "elem1", "mv1")
+        cache_file = tmp_path / "geometry.fs"
+        cache_file.write_text("v1")
+
+        assert manager.resolve_import("std/geometry.fs", fetch_if_missing=False) == "v1"
+        assert manager.get_cached("geometry.fs") is manager.get_cached("geometry.fs")
+
+        cache_file.write_text("v2")
+        os.utime(cache_file, ns=(1, 1))
+        assert manager.get_cached("geometry.fs") == "v2"
+
+        cache_file.unlink()
+        assert manager.get_cached("geometry.fs") is None
+
+
+class FakeClient:
+    """Serves Feature Studio contents keyed by element ID."""
+
+    def __init__(self, responses: dict[str, dict[str, str]]) -> None:
+        self.responses = responses
+
+    def get_featurestudio_contents(
+        self, document_id: str, workspace_id: str, element_id: str
+    ) -> dict[str, str]:
+        if element_id not in self.responses:
+            raise RuntimeError(f"no element {element_id}")
+        return self.responses[element_id]
+
+
+class TestUpdate:
+    """Tests for CacheManager.update."""
+
+    def test_update_all(self, tmp_path: Path) -> None:
+        client = FakeClient({
+            "e1": {"microversion": "mv1", "contents": "old"},
+            "e2": {"microversion": "mv2-new", "contents": "new contents"},
+        })
+        manager = CacheManager(tmp_path, client=client)  # type: ignore[arg-type]
+        manager.add_to_manifest("same.fs", "doc", "e1", "mv1", defer_save=True)
+        manager.add_to_manifest("changed.fs", "doc", "e2", "mv2", defer_save=True)
+        manager.add_to_manifest("missing.fs", "doc", "e3", "mv3", defer_save=True)
+        assert not (tmp_path / "manifest.json").exists()
+        manager.flush()
+
+        results = manager.update()
+
+        assert results == {"same.fs": True, "changed.fs": True, "missing.fs": False}
+        assert (tmp_path / "changed.fs").read_text() == "new contents"
+        assert not (tmp_path / "same.fs").exists()
+        reloaded = CacheManager(tmp_path).manifest
+        assert reloaded.documents["changed.fs"].microversion == "mv2-new"
+        assert reloaded.documents["same.fs"].microversion == "mv1"
+        assert reloaded.last_updated is not None
@@ -0,0 +1,257 @@
+"""Tests for the Onshape API client."""
+
+import json
+from typing import Any
+
+import pytest
+
+from sync.core.auth import OnshapeAuth
+from sync.core.client import OnshapeAPIError, OnshapeClient
+
+# Folder hierarchy: root -> (a -> (c), b), each folder holding one document
+FOLDERS: dict[str, dict[str, Any]] = {
+    "root": {
+        "name": "Root",
+        "items": [
+            {"resourceType": "folder", "id": "a", "name": "A"},
+            {"resourceType": "document", "id": "doc_root", "name": "Root Doc"},
+            {"resourceType": "folder", "id": "b", "name": "B"},
+        ],
+    },
+    "a": {
+        "name": "A",
+        "items": [
+            {"resourceType": "document", "id": "doc_a", "name": "A Doc"},
+            {"resourceType": "folder", "id": "c", "name": "C"},
+        ],
+    },
+    "b": {
+        "name": "B",
+        "items": [{"resourceType": "document", "id": "doc_b", "name": "B Doc"}],
+    },
+    "c": {
+        "name": "C",
+        "items": [{"resourceType": "document", "id": "doc_c", "name": "C Doc"}],
+    },
+}
+
+
+@pytest.fixture
+def client(monkeypatch: pytest.MonkeyPatch) -> OnshapeClient:
+    client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+    monkeypatch.setattr(client, "get_folder_contents", lambda folder_id: FOLDERS[folder_id])
+    return client
+
+
+class TestFolderOperations:
+    """Tests for folder listing and tree building."""
+
+    def test_list_folder_documents_recursive(self, client: OnshapeClient) -> None:
+        documents = client.list_folder_documents("root", recursive=True)
+
+        assert [(d["id"], d["folder_path"]) for d in documents] == [
+            ("doc_a", "A"),
+            ("doc_c", "A/C"),
+            ("doc_root", ""),
+            ("doc_b", "B"),
+        ]
+
+    def test_list_folder_documents_non_recursive(self, client: OnshapeClient) -> None:
+        documents = client.list_folder_documents("root")
+
+        assert [d["id"] for d in documents] == ["doc_root"]
+
+    def test_get_folder_tree_max_depth(self, client: OnshapeClient) -> None:
+        tree = client.get_folder_tree("root", max_depth=1)
+
+        assert [d["id"] for d in tree["documents"]] == ["doc_root"]
+        assert [f["name"] for f in tree["folders"]] == ["A", "B"]
+        folder_a = tree["folders"][0]
+        assert [d["id"] for d in folder_a["documents"]] == ["doc_a"]
+        assert folder_a["folders"] == []
+
+    def test_get_folder_contents_follows_pages(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        pages = {
+            "/api/v10/globaltreenodes/folder/f1": {
+                "name": "F1",
+                "items": [{"id": "d1"}],
+                "next": "https://cad.onshape.com/api/v10/globaltreenodes/folder/f1?offset=1",
+            },
+            "/api/v10/globaltreenodes/folder/f1?offset=1": {"items": [{"id": "d2"}]},
+        }
+
+        def fake_get(path: str, query_params: dict[str, str] | None = None) -> dict[str, Any]:
+            query = "&".join(f"{k}={v}" for k, v in (query_params or {}).items())
+            return dict(pages[f"{path}?{query}" if query else path])
+
+        monkeypatch.setattr(client, "get", fake_get)
+
+        contents = client.get_folder_contents("f1")
+
+        assert contents["name"] == "F1"
+        assert [item["id"] for item in contents["items"]] == ["d1", "d2"]
+        assert "next" not in contents
+
+
+class TestLookupCache:
+    """Tests for memoized document lookups."""
+
+    def test_microversion_cached_until_invalidated(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        calls: list[str] = []
+
+        def fake_request(
+            method: str,
+            path: str,
+            query_params: dict[str, str] | None = None,
+            json_data: dict[str, Any] | None = None,
+        ) -> dict[str, Any]:
+            calls.append(method)
+            return {"microversion": f"mv{len(calls)}"}
+
+        monkeypatch.setattr(client, "_request", fake_request)
+
+        assert client.get_document_microversion("doc1", "ws1") == "mv1"
+        assert client.get_document_microversion("doc1", "ws1") == "mv1"
+        assert calls == ["GET"]
+
+        # Pushing contents invalidates the document's cached lookups
+        client.update_featurestudio_contents("doc1", "ws1", "elem1", "contents")
+        assert client.get_document_microversion("doc1", "ws1") == "mv3"
+
+        client.clear_cache()
+        assert client.get_document_microversion("doc1", "ws1") == "mv4"
+
+    def test_list_elements_cached_per_filter(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        calls: list[dict[str, str] | None] = []
+
+        def fake_get(path: str, query_params: dict[str, str] | None = None) -> Any:
+            calls.append(query_params)
+            return [{"id": f"e{len(calls)}"}]
+
+        monkeypatch.setattr(client, "get", fake_get)
+
+        assert client.list_elements("doc1", "ws1", "FEATURESTUDIO") == [{"id": "e1"}]
+        assert client.list_elements("doc1", "ws1", "FEATURESTUDIO") == [{"id": "e1"}]
+        assert client.list_elements("doc1", "ws1") == [{"id": "e2"}]
+        assert calls == [{"elementType": "FEATURESTUDIO"}, None]
+
+        client.invalidate("doc1")
+        assert client.list_elements("doc1", "ws1", "FEATURESTUDIO") == [{"id": "e3"}]
+
+    def test_cached_results_are_copies(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        responses: dict[str, Any] = {
+            "elements": [{"id": "e1"}],
+            "d/doc1": {"name": "Doc"},
+            "folder/f1": {"items": [{"id": "doc1"}]},
+        }
+
+        def fake_get(path: str, query_params: dict[str, str] | None = None) -> Any:
+            return next(value for suffix, value in responses.items() if path.endswith(suffix))
+
+        monkeypatch.setattr(client, "get", fake_get)
+
+        client.list_elements("doc1", "ws1").append({"id": "e2"})
+        client.get_document_info("doc1")["name"] = "Changed"
+        client.get_folder_contents("f1")["items"].clear()
+
+        assert client.list_elements("doc1", "ws1") == [{"id": "e1"}]
+        assert client.get_document_info("doc1") == {"name": "Doc"}
+        assert client.get_folder_contents("f1")["items"] == [{"id": "doc1"}]
+
+    def test_clear_cache_by_kind(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        calls: list[str] = []
+
+        def fake_get(path: str, query_params: dict[str, str] | None = None) -> Any:
+            calls.append(path)
+            return {"microversion": f"mv{len(calls)}", "name": "Doc"}
+
+        monkeypatch.setattr(client, "get", fake_get)
+        client.get_document_microversion("doc1", "ws1")
+        client.get_document_info("doc1")
+
+        client.clear_cache("microversion")
+
+        assert client.get_document_microversion("doc1", "ws1") == "mv3"
+        assert client.get_document_info("doc1")["microversion"] == "mv2"
+        assert len(calls) == 3
+
+
+class FakeResponse:
+    """Minimal requests.Response stand-in."""
+
+    encoding = "utf-8"
+
+    def __init__(self, content: bytes, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.headers: dict[str, str] = {}
+        self.text = content.decode()
+
+
+class TestRequest:
+    """Tests for request encoding."""
+
+    def test_post_body_encoded_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        sent: dict[str, Any] = {}
+
+        def fake_request(**kwargs: Any) -> FakeResponse:
+            sent.update(kwargs)
+            return FakeResponse(b'{"microversion": "mv2"}')
+
+        monkeypatch.setattr(client.session, "request", fake_request)
+
+        response = client.update_featurestudio_contents("doc1", "ws1", "elem1", "café")
+
+        assert response == {"microversion": "mv2"}
+        assert json.loads(sent["data"]) == {"contents": "café"}
+        assert sent["headers"]["Content-Type"] == "application/json"
+        assert sent["url"].endswith("/featurestudios/d/doc1/w/ws1/e/elem1/featurestudiocontents")
+
+    def test_retry_signs_each_attempt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        sent: list[dict[str, str]] = []
+        responses = [FakeResponse(b"busy", 503), FakeResponse(b'{"ok": true}')]
+
+        def fake_request(**kwargs: Any) -> FakeResponse:
+            sent.append(kwargs["headers"])
+            return responses.pop(0)
+
+        monkeypatch.setattr(client.session, "request", fake_request)
+        monkeypatch.setattr("sync.core.client.time.sleep", lambda seconds: None)
+
+        assert client.get("/api/v10/documents") == {"ok": True}
+        assert len(sent) == 2
+        assert sent[0]["On-Nonce"] != sent[1]["On-Nonce"]
+        assert sent[0]["Authorization"] != sent[1]["Authorization"]
+
+    @pytest.mark.parametrize(
+        ("retry_after", "delay"),
+        [("2", 2.0), ("1.5", 1.5), ("86400", 60.0), ("-5", 0.6), ("inf", 0.6), ("soon", 0.6)],
+    )
+    def test_retry_delay(self, retry_after: str, delay: float) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        response: Any = FakeResponse(b"busy", 503)
+        response.headers["Retry-After"] = retry_after
+
+        assert client._retry_delay(response, attempt=1) == pytest.approx(delay)
+
+    def test_post_not_retried(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = OnshapeClient(OnshapeAuth(access_key="test", secret_key="test"))
+        calls: list[Any] = []
+
+        def fake_request(**kwargs: Any) -> FakeResponse:
+            calls.append(kwargs)
+            return FakeResponse(b"busy", 503)
+
+        monkeypatch.setattr(client.session, "request", fake_request)
+
+        with pytest.raises(OnshapeAPIError) as excinfo:
+            client.post("/api/v10/documents", json_data={"name": "x"})
+        assert excinfo.value.status_code == 503
+        assert len(calls) == 1
@@ -0,0 +1,48 @@
+"""Tests for API response inspection helpers."""
+
+from sync.core.inspector import _find_differences
+
+
+class TestFindDifferences:
+    """Tests for _find_differences."""
+
+    def test_identical(self) -> None:
+        data = {"a": [1, {"b": "x"}], "c": None}
+        assert _find_differences(data, {"a": [1, {"b": "x"}], "c": None}) == []
+
+    def test_reports_nested_differences(self) -> None:
+        obj1 = {"items": [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}], "n": 1}
+        obj2 = {"items": [{"id": 1, "name": "a"}, {"id": 2, "name": "c"}], "n": "1"}
+
+        assert sorted(_find_differences(obj1, obj2)) == [
+            "root.items[1].name: b != c",
+            "root.n: Type mismatch (int vs str)",
+        ]
+
+    def test_missing_keys_and_lengths(self) -> None:
+        differences = _find_differences(
+            {"only1": 1, "list": [1, 2]},
+            {"only2": 2, "list": [1]},
+        )
+
+        assert sorted(differences) == [
+            "root.list: List length mismatch (2 vs 1)",
+            "root.only1: Only in first object",
+            "root.only2: Only in second object",
+        ]
+
+    def test_deep_nesting(self) -> None:
+        obj1: dict = {}
+        obj2: dict = {}
+        node1, node2 = obj1, obj2
+        for _ in range(5000):
+            node1["x"] = {}
+            node2["x"] = {}
+            node1, node2 = node1["x"], node2["x"]
+        node1["leaf"] = 1
+        node2["leaf"] = 2
+
+        differences = _find_differences(obj1, obj2)
+
+        assert len(differences) == 1
+        assert differences[0].endswith(".leaf: 1 != 2")
@@ -0,0 +1,37 @@
+"""Tests for the shared JSON helpers."""
+
+import pytest
+
+from sync import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test against orjson (when installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return str(request.param)
+
+
+class TestJsonIO:
+    """Tests for jsonio.dumps and jsonio.loads."""
+
+    @pytest.mark.parametrize("indent", [False, True])
+    def test_non_ascii_path_round_trip(self, backend: str, indent: bool) -> None:
+        data = {"files": {"lib/Teilebibliothek/Größe.fs": {"local_hash": "abc"}}}
+
+        encoded = jsonio.dumps(data, indent=indent)
+
+        assert "Größe.fs".encode() in encoded
+        assert jsonio.loads(encoded) == data
+
+    def test_backends_agree(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        pytest.importorskip("orjson")
+        data = {"name": "Größe", "items": [1, 2.5, None, True]}
+
+        fast = jsonio.dumps(data), jsonio.dumps(data, indent=True)
+        monkeypatch.setattr(jsonio, "orjson", None)
+
+        assert (jsonio.dumps(data), jsonio.dumps(data, indent=True)) == fast
@@ -1,7 +1,10 @@
 """Tests for data models."""
 
 import json
+import ntpath
+import os
 import tempfile
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
@@ -10,9 +13,12 @@ from sync.models.config import (
     CacheEntry,
     CacheManifest,
     DocumentConfig,
+    FolderConfig,
     SyncConfig,
     SyncSettings,
+    sanitize_filename,
 )
+from sync.models.project_config import FeatureScriptSettings, ReferenceConfig
 
 
 class TestCacheEntry:
@@ -85,6 +91,22 @@ class TestCacheManifest:
         assert "test.fs" in restored.documents
         assert restored.documents["test.fs"].document_id == "doc123"
 
+    def test_from_dict_ignores_extra_entry_keys(self) -> None:
+        entry = {
+            "document_id": "doc123",
+            "element_id": "elem456",
+            "microversion": "mv789",
+            "fetched_at": "2026-01-31T12:00:00Z",
+            "onshape_version": "2878",
+        }
+        data = {"documents": {"a.fs": dict(entry), "b.fs": {**entry, "extra": "x"}}}
+
+        restored = CacheManifest.from_dict(data)
+
+        assert restored.documents["a.fs"] == CacheEntry(**entry)
+        assert restored.documents["b.fs"] == CacheEntry(**entry)
+        assert not hasattr(restored.documents["b.fs"], "extra")
+
     def test_update_timestamp(self) -> None:
         manifest = CacheManifest()
         assert manifest.last_updated is None
@@ -95,6 +117,59 @@ class TestCacheManifest:
         assert "T" in manifest.last_updated  # ISO format
 
 
+class TestSanitizeFilename:
+    """Tests for sanitize_filename."""
+
+    def test_replaces_invalid_characters(self) -> None:
+        assert sanitize_filename('a<b>c:d"e/f\\g|h?i*j') == "a_b_c_d_e_f_g_h_i_j"
+
+    def test_collapses_whitespace_and_underscores(self) -> None:
+        assert sanitize_filename("  My   Part__Studio  ") == "My_Part_Studio"
+
+    def test_empty_result(self) -> None:
+        assert sanitize_filename("???") == "unnamed"
+
+
+class TestFolderConfig:
+    """Tests for FolderConfig exclude matching."""
+
+    def test_should_exclude(self) -> None:
+        folder = FolderConfig(
+            name="Lib",
+            folder_id="folder123",
+            local_path="./lib",
+            exclude=["*_old", "Archive", "drafts/*"],
+        )
+
+        assert folder.should_exclude("Bracket_old")
+        assert folder.should_exclude("sub/Bracket_old")  # Matches on name portion
+        assert folder.should_exclude("Archive")
+        assert folder.should_exclude("sub/Archive")
+        assert folder.should_exclude("drafts/Bracket")
+        assert not folder.should_exclude("Bracket")
+        assert not folder.should_exclude("Archive/Bracket")
+
+    def test_should_exclude_windows_normcase(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # ntpath.normcase lowercases and turns '/' into '\\'
+        monkeypatch.setattr(os.path, "normcase", ntpath.normcase)
+        folder = FolderConfig(
+            name="Lib",
+            folder_id="folder123",
+            local_path="./lib",
+            exclude=["*_old", "Archive", "drafts/*"],
+        )
+
+        assert folder.should_exclude("sub/Bracket_OLD")
+        assert folder.should_exclude("sub/archive")
+        assert folder.should_exclude("Drafts/Bracket")
+        assert not folder.should_exclude("Archive/Bracket")
+
+    def test_should_exclude_no_patterns(self) -> None:
+        folder = FolderConfig(name="Lib", folder_id="folder123", local_path="./lib")
+
+        assert not folder.should_exclude("anything")
+
+
 class TestSyncConfig:
     """Tests for SyncConfig model."""
 
@@ -135,3 +210,69 @@ settings:
             assert config.settings.verbose is True
         finally:
             config_path.unlink()
+
+    def test_save_load_roundtrip(self) -> None:
+        config = SyncConfig(
+            folders=[FolderConfig(name="Lib", folder_id="f1", local_path="./lib", exclude=["*_old"])],
+            documents=[
+                DocumentConfig(
+                    name="Test Doc",
+                    document_id="abc123",
+                    workspace_id="main",
+                    local_path="./test",
+                )
+            ],
+            settings=SyncSettings(verbose=True),
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config.save(config_path)
+            restored = SyncConfig.load(config_path)
+
+        assert restored == config
+        assert restored.folders[0].should_exclude("Bracket_old")
+
+
+class TestFeatureScriptSettings:
+    """Tests for FeatureScriptSettings persistence."""
+
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
+        settings = FeatureScriptSettings(references=[
+            ReferenceConfig(
+                name="Std – Library",
+                type="folder",
+                url="https://cad.onshape.com/documents/folder/f1",
+                local_path="./references/std",
+                folder_id="f1",
+            )
+        ])
+        settings.update_document_cache("doc1", "Doc", "2026-01-01", "mv1")
+        path = tmp_path / "nested" / "featurescriptSettings.json"
+
+        settings.save(path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == settings.to_dict()
+        assert path.read_text(encoding="utf-8").startswith('{\n  "version": "1.0"')
+        assert FeatureScriptSettings.load(path) == settings
+        assert FeatureScriptSettings.load(tmp_path / "missing.json") == FeatureScriptSettings()
+
+
+class TestReferenceConfig:
+    """Tests for ReferenceConfig."""
+
+    def test_last_sync_dt_follows_last_sync(self) -> None:
+        ref = ReferenceConfig(name="std", type="folder", url="u", local_path="./std")
+        assert ref.last_sync_dt is None
+
+        ref.last_sync = "2026-01-02T03:04:05+00:00"
+        first = ref.last_sync_dt
+        assert first == datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        assert ref.last_sync_dt is first
+
+        ref.update_sync_time()
+        assert ref.last_sync_dt == datetime.fromisoformat(ref.last_sync)
+
+        ref.last_sync = "not a date"
+        assert ref.last_sync_dt is None
+        assert ref == ReferenceConfig.from_dict(ref.to_dict())
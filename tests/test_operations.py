@@ -0,0 +1,421 @@
+"""Tests for pull and push sync operations."""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sync.core.operations import SyncOperations
+from sync.core.state import SyncState
+from sync.models.config import FolderConfig, SyncConfig
+
+
+class FakeClient:
+    """In-memory stand-in for OnshapeClient covering the sync endpoints."""
+
+    def __init__(self, documents: dict[str, dict[str, Any]]) -> None:
+        # document ID -> {"name", "folder_path", "elements": {element ID: (name, contents)}}
+        self.documents = documents
+        self.microversions: dict[str, str] = dict.fromkeys(documents, "mv1")
+        self.calls: list[tuple[str, str]] = []
+        self.cleared: list[str | None] = []
+        self._lock = threading.Lock()
+
+    def clear_cache(self, kind: str | None = None) -> None:
+        self.cleared.append(kind)
+
+    def _record(self, name: str, document_id: str) -> None:
+        with self._lock:
+            self.calls.append((name, document_id))
+
+    def list_folder_documents(self, folder_id: str, recursive: bool = True) -> list[dict[str, Any]]:
+        return [
+            {"id": doc_id, "name": doc["name"], "folder_path": doc.get("folder_path", "")}
+            for doc_id, doc in self.documents.items()
+        ]
+
+    def get_default_workspace(self, document_id: str) -> str:
+        self._record("get_default_workspace", document_id)
+        return "ws"
+
+    def list_elements(
+        self, document_id: str, workspace_id: str, element_type: str | None = None
+    ) -> list[dict[str, Any]]:
+        self._record("list_elements", document_id)
+        return [
+            {"id": element_id, "name": name}
+            for element_id, (name, _) in self.documents[document_id]["elements"].items()
+        ]
+
+    def get_featurestudio_contents(
+        self, document_id: str, workspace_id: str, element_id: str
+    ) -> dict[str, Any]:
+        self._record("get_featurestudio_contents", document_id)
+        _, contents = self.documents[document_id]["elements"][element_id]
+        return {"contents": contents, "microversion": self.microversions[document_id]}
+
+    def get_document_microversion(self, document_id: str, workspace_id: str) -> str:
+        self._record("get_document_microversion", document_id)
+        return self.microversions[document_id]
+
+    def update_featurestudio_contents(
+        self, document_id: str, workspace_id: str, element_id: str, contents: str
+    ) -> dict[str, Any]:
+        self._record("update_featurestudio_contents", document_id)
+        name, _ = self.documents[document_id]["elements"][element_id]
+        self.documents[document_id]["elements"][element_id] = (name, contents)
+        self.microversions[document_id] += "+"
+        return {"microversion": self.microversions[document_id]}
+
+
+def make_ops(tmp_path: Path, client: FakeClient) -> tuple[SyncOperations, FolderConfig]:
+    folder = FolderConfig(name="Lib", folder_id="folder1", local_path="lib")
+    config = SyncConfig(folders=[folder])
+    config.settings.backup_on_pull = False
+    ops = SyncOperations(config, client=client, base_dir=tmp_path)  # type: ignore[arg-type]
+    return ops, folder
+
+
+DOCUMENTS = {
+    f"doc{i}": {
+        "name": f"Doc {i}",
+        "folder_path": "Sub" if i % 2 else "",
+        "elements": {f"e{i}a": ("Alpha", f"// {i}a\n"), f"e{i}b": ("Beta", f"// {i}b\n")},
+    }
+    for i in range(6)
+}
+
+
+def fresh_client() -> FakeClient:
+    """Return a FakeClient over a private copy of DOCUMENTS."""
+    return FakeClient({k: dict(v, elements=dict(v["elements"])) for k, v in DOCUMENTS.items()})
+
+
+class TestPullFolder:
+    """Tests for SyncOperations.pull_folder."""
+
+    def test_pulls_every_document_in_order(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+
+        results = ops.pull_folder(folder)
+
+        assert all(r.success for r in results)
+        assert [r.filepath for r in results] == [
+            str(Path("lib", *(["Sub"] if i % 2 else []), f"Doc_{i}", f"{name}.fs"))
+            for i in range(6)
+            for name in ("Alpha", "Beta")
+        ]
+        assert (tmp_path / "lib" / "Sub" / "Doc_1" / "Beta.fs").read_text() == "// 1b\n"
+        assert len(ops.state.state.files) == 12
+        assert (tmp_path / "lib" / "Doc_0" / ".document.json").exists()
+
+    def test_state_saved_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        writes = []
+        real_replace = os.replace
+        monkeypatch.setattr(
+            "sync.core.state.os.replace",
+            lambda src, dst: (writes.append(dst), real_replace(src, dst)),
+        )
+
+        ops.pull_folder(folder)
+
+        assert writes == [tmp_path / ".sync-state.json"]
+        assert len(SyncState(tmp_path / ".sync-state.json").state.files) == 12
+
+
+class TestPushFolder:
+    """Tests for SyncOperations.push_folder."""
+
+    def test_pushes_document_folders(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+
+        (tmp_path / "lib" / "Sub" / "Doc_3" / "Alpha.fs").write_text("// edited\n")
+        # Hidden directories are not searched for document metadata
+        hidden = tmp_path / "lib" / ".hidden" / "nested"
+        hidden.mkdir(parents=True)
+        (hidden / ".document.json").write_text("{}")
+
+        results = ops.push_folder(folder)
+
+        assert len(results) == 12
+        assert not any(".hidden" in r.filepath for r in results)
+        assert client.documents["doc3"]["elements"]["e3a"] == ("Alpha", "// edited\n")
+        # Only the edited file reached the API; unchanged files were skipped locally
+        assert all(r.success for r in results)
+        assert [r.filepath for r in results if not r.skipped] == [
+            str(Path("lib", "Sub", "Doc_3", "Alpha.fs"))
+        ]
+        assert client.calls.count(("update_featurestudio_contents", "doc3")) == 1
+        assert client.calls.count(("get_document_microversion", "doc3")) == 1
+
+    def test_pushes_hidden_document_folder(self, tmp_path: Path) -> None:
+        client = FakeClient({
+            "drafts": {"name": ".Drafts", "elements": {"ed": ("Alpha", "// draft\n")}},
+        })
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        (tmp_path / "lib" / ".Drafts" / "Alpha.fs").write_text("// edited\n")
+
+        results = ops.push_folder(folder)
+
+        assert [(r.filepath, r.skipped) for r in results] == [
+            (str(Path("lib", ".Drafts", "Alpha.fs")), False)
+        ]
+        assert client.documents["drafts"]["elements"]["ed"] == ("Alpha", "// edited\n")
+
+    def test_changed_file_read_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        edited = tmp_path / "lib" / "Doc_0" / "Alpha.fs"
+        edited.write_text("// edited\n")
+        reads: list[Path] = []
+        real_read_bytes = Path.read_bytes
+        monkeypatch.setattr(
+            Path, "read_bytes", lambda path: (reads.append(path), real_read_bytes(path))[1]
+        )
+        monkeypatch.setattr(SyncState, "hash_file", None)
+
+        results = ops.push_folder(folder)
+
+        assert [r.filepath for r in results if not r.skipped] == [
+            str(Path("lib", "Doc_0", "Alpha.fs"))
+        ]
+        assert reads == [edited]
+
+    def test_clean_tree_push_is_local(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        client.calls.clear()
+
+        results = ops.push_folder(folder)
+
+        assert len(results) == 12
+        assert all(r.success and r.skipped for r in results)
+        assert client.calls == []
+
+    def test_microversion_fetched_once_per_document(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        client.calls.clear()
+
+        results = ops.push_folder(folder, force=True)
+
+        assert len(results) == 12
+        assert not any(r.skipped for r in results)
+        for doc_id in DOCUMENTS:
+            assert client.calls.count(("get_document_microversion", doc_id)) == 1
+            assert client.calls.count(("update_featurestudio_contents", doc_id)) == 2
+
+    def test_two_edited_files_in_one_document(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        doc_dir = tmp_path / "lib" / "Doc_0"
+        (doc_dir / "Alpha.fs").write_text("// edited a\n")
+        (doc_dir / "Beta.fs").write_text("// edited b\n")
+        client.calls.clear()
+
+        results = ops.push_folder(folder)
+
+        # Pushing Alpha advances the microversion; that is not a remote change for Beta
+        assert not any(r.conflict for r in results)
+        assert sorted(r.filepath for r in results if not r.skipped) == [
+            str(Path("lib", "Doc_0", name)) for name in ("Alpha.fs", "Beta.fs")
+        ]
+        assert client.documents["doc0"]["elements"]["e0b"] == ("Beta", "// edited b\n")
+        assert client.calls.count(("get_document_microversion", "doc0")) == 1
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_next_push_after_two_files_does_not_conflict(
+        self, tmp_path: Path, parallel: bool
+    ) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        ops.config.settings.parallel_push = parallel
+        doc_dir = tmp_path / "lib" / "Doc_0"
+        (doc_dir / "Alpha.fs").write_text("// edited a\n")
+        (doc_dir / "Beta.fs").write_text("// edited b\n")
+        assert all(r.success for r in ops.push_folder(folder))
+
+        # A later run must treat the whole batch as synced, not just its last file
+        (doc_dir / "Alpha.fs").write_text("// edited a again\n")
+        ops, _ = make_ops(tmp_path, client)
+        results = ops.push_folder(folder)
+
+        assert not any(r.conflict for r in results)
+        assert client.documents["doc0"]["elements"]["e0a"] == ("Alpha", "// edited a again\n")
+
+    def test_remote_change_still_conflicts(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        (tmp_path / "lib" / "Doc_0" / "Alpha.fs").write_text("// edited a\n")
+        client.microversions["doc0"] = "mv-remote"
+
+        results = ops.push_folder(folder)
+
+        assert [r.filepath for r in results if r.conflict] == [
+            str(Path("lib", "Doc_0", "Alpha.fs"))
+        ]
+        assert client.calls.count(("update_featurestudio_contents", "doc0")) == 0
+
+    def test_parallel_push_two_edited_files(self, tmp_path: Path) -> None:
+        results_by_mode = {}
+        for parallel in (False, True):
+            client = fresh_client()
+            base_dir = tmp_path / str(parallel)
+            ops, folder = make_ops(base_dir, client)
+            ops.pull_folder(folder)
+            ops.config.settings.parallel_push = parallel
+            (base_dir / "lib" / "Doc_0" / "Alpha.fs").write_text("// edited a\n")
+            (base_dir / "lib" / "Doc_0" / "Beta.fs").write_text("// edited b\n")
+
+            results_by_mode[parallel] = sorted(
+                (r.filepath, r.success, r.skipped, r.conflict) for r in ops.push_folder(folder)
+            )
+
+        assert results_by_mode[True] == results_by_mode[False]
+        assert sum(not skipped for _, _, skipped, _ in results_by_mode[True]) == 2
+        assert not any(conflict for *_, conflict in results_by_mode[True])
+
+    def test_parallel_push_matches_serial(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+        ops.config.settings.parallel_push = True
+        (tmp_path / "lib" / "Doc_0" / "Beta.fs").write_text("// edited\n")
+        client.calls.clear()
+
+        results = ops.push_folder(folder)
+
+        assert sorted(r.filepath for r in results) == sorted(
+            str(Path("lib", *(["Sub"] if i % 2 else []), f"Doc_{i}", f"{name}.fs"))
+            for i in range(6)
+            for name in ("Alpha", "Beta")
+        )
+        assert [r.filepath for r in results if not r.skipped] == [
+            str(Path("lib", "Doc_0", "Beta.fs"))
+        ]
+        assert client.calls == [
+            ("get_document_microversion", "doc0"),
+            ("update_featurestudio_contents", "doc0"),
+        ]
+
+        client.calls.clear()
+        results = ops.push_folder(folder, force=True)
+
+        assert all(r.success and not r.skipped for r in results)
+        for doc_id in DOCUMENTS:
+            # Once before the batch, once after it to record where it ended
+            assert client.calls.count(("get_document_microversion", doc_id)) == 2
+            assert client.calls.count(("update_featurestudio_contents", doc_id)) == 2
+
+    def test_push_hashes_raw_bytes(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, folder = make_ops(tmp_path, client)
+        ops.pull_folder(folder)
+
+        edited = tmp_path / "lib" / "Doc_0" / "Alpha.fs"
+        edited.write_bytes(b"// line 1\r\n// line 2\r\n")
+        ops.push_folder(folder)
+
+        # Onshape receives LF text; the state records the hash of the file as stored
+        assert client.documents["doc0"]["elements"]["e0a"] == ("Alpha", "// line 1\n// line 2\n")
+        file_state = ops.state.get_file_state(str(edited.relative_to(tmp_path)))
+        assert file_state is not None
+        assert file_state.local_hash == SyncState.compute_hash_bytes(edited.read_bytes())
+
+
+class TestSyncAll:
+    """Tests for SyncOperations.pull_all and push_all."""
+
+    def test_microversions_refetched_every_run(self, tmp_path: Path) -> None:
+        client = fresh_client()
+        ops, _ = make_ops(tmp_path, client)
+
+        ops.pull_all()
+        ops.push_all()
+        ops.push_all(force=True)
+
+        assert client.cleared == ["microversion", "microversion", None]
+
+
+class TestBackupFile:
+    """Tests for SyncOperations._backup_file."""
+
+    def test_backup_existing_and_missing(self, tmp_path: Path) -> None:
+        ops, _ = make_ops(tmp_path, FakeClient({}))
+        ops.config.settings.backup_on_pull = True
+
+        assert ops._backup_file(tmp_path / "missing.fs") is None
+        assert not (tmp_path / ".sync-backups").exists()
+
+        source = tmp_path / "part.fs"
+        source.write_text("// part\n")
+        backup = ops._backup_file(source)
+
+        assert backup is not None
+        assert backup.parent == tmp_path / ".sync-backups"
+        assert backup.read_text() == "// part\n"
+
+    def test_repull_keeps_a_backup_per_file(self, tmp_path: Path) -> None:
+        ops, folder = make_ops(tmp_path, fresh_client())
+        ops.pull_folder(folder)
+        ops.config.settings.backup_on_pull = True
+
+        ops.pull_folder(folder, force=True)
+
+        backups = sorted(
+            str(p.relative_to(tmp_path / ".sync-backups"))
+            for p in (tmp_path / ".sync-backups").rglob("*.fs")
+        )
+        assert len(backups) == 12
+        assert backups[0].startswith(str(Path("lib", "Doc_0", "Alpha_")))
+
+
+class TestDocumentMetadata:
+    """Tests for SyncOperations document metadata loading."""
+
+    def test_load_reuses_parse_until_file_changes(self, tmp_path: Path) -> None:
+        ops, folder = make_ops(tmp_path, fresh_client())
+        ops.pull_folder(folder)
+        doc_dir = tmp_path / "lib" / "Doc_0"
+
+        first = ops._load_document_metadata(doc_dir)
+        assert first is not None
+        assert ops._load_document_metadata(doc_dir) is first
+
+        # Another process rewriting the file is picked up
+        metadata_path = doc_dir / ".document.json"
+        data = metadata_path.read_text().replace("Doc 0", "Renamed document")
+        metadata_path.write_text(data)
+        reloaded = ops._load_document_metadata(doc_dir)
+        assert reloaded is not first
+        assert reloaded is not None and reloaded.document_name == "Renamed document"
+
+        metadata_path.unlink()
+        assert ops._load_document_metadata(doc_dir) is None
+
+
+class TestRel:
+    """Tests for SyncOperations._rel."""
+
+    def test_matches_relative_to(self, tmp_path: Path) -> None:
+        ops, _ = make_ops(tmp_path, FakeClient({}))
+        path = tmp_path / "lib" / "Doc_0" / "Alpha.fs"
+
+        assert ops._rel(path) == str(path.relative_to(tmp_path))
+        # A sibling sharing the base name as a prefix is not inside base_dir
+        outside = tmp_path.parent / (tmp_path.name + "x") / "a.fs"
+        assert ops._rel(outside) == str(outside)
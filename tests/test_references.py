@@ -0,0 +1,152 @@
+"""Tests for reference library management."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from sync.core.references import ReferenceManager
+from sync.models.project_config import FeatureScriptSettings, ReferenceConfig
+
+
+def make_ref(name: str) -> ReferenceConfig:
+    return ReferenceConfig(
+        name=name,
+        type="folder",
+        url=f"https://cad.onshape.com/documents/folder/{name}",
+        local_path=f"./references/{name}",
+        folder_id=name,
+    )
+
+
+def make_manager(tmp_path: Path, *names: str) -> ReferenceManager:
+    settings = FeatureScriptSettings(references=[make_ref(name) for name in names])
+    client: Any = object()  # never called by these tests
+    return ReferenceManager(settings, tmp_path / "featurescriptSettings.json", tmp_path, client)
+
+
+class TestReferenceIndex:
+    """Tests for the ReferenceManager name index."""
+
+    def test_lookup_follows_settings_changes(self, tmp_path: Path) -> None:
+        manager = make_manager(tmp_path, "std", "corp")
+
+        assert manager._get_reference("corp") is manager.settings.references[1]
+        assert manager._get_reference("missing") is None
+
+        manager.settings.add_reference(make_ref("extra"))
+        assert manager._get_reference("extra") is not None
+
+        manager.remove_reference("std")
+        assert manager._get_reference("std") is None
+        assert [name for name, _ in manager._reference_paths()] == ["corp", "extra"]
+
+    def test_reference_paths_resolved_once(self, tmp_path: Path) -> None:
+        manager = make_manager(tmp_path, "std")
+
+        paths = manager._reference_paths()
+
+        assert paths == [("std", (tmp_path / "references" / "std").resolve())]
+        assert manager._reference_paths() is paths
+
+
+class TestValidatePushAllowed:
+    """Tests for ReferenceManager.validate_push_allowed."""
+
+    def test_rejects_reference_directories(self, tmp_path: Path) -> None:
+        manager = make_manager(tmp_path, "std", "corp")
+
+        for path in (tmp_path / "references" / "corp", tmp_path / "references" / "std" / "sub"):
+            with pytest.raises(ValueError, match="read-only"):
+                manager.validate_push_allowed(str(path))
+
+    def test_allows_other_directories(self, tmp_path: Path) -> None:
+        manager = make_manager(tmp_path, "std")
+
+        manager.validate_push_allowed(str(tmp_path / "projects" / "part"))
+        manager.validate_push_allowed(str(tmp_path / "references" / "std2"))
+
+
+class FakeVersionClient:
+    """Answers microversion lookups; documents named 'broken' fail."""
+
+    def __init__(self) -> None:
+        self.checked: list[str] = []
+
+    def get_default_workspace(self, document_id: str) -> str:
+        return "ws"
+
+    def get_document_microversion(self, document_id: str, workspace_id: str) -> str:
+        self.checked.append(document_id)
+        if document_id == "broken":
+            raise RuntimeError("connection reset")
+        return "mv2" if document_id == "changed" else "mv1"
+
+
+class FakeSyncOperations:
+    """Stands in for SyncOperations; every pull succeeds with no files."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+    def pull_all(self, dry_run: bool = False, force: bool = False) -> list[Any]:
+        return []
+
+
+def make_document_manager(tmp_path: Path, client: Any) -> ReferenceManager:
+    settings = FeatureScriptSettings()
+    for doc_id in ("same", "changed", "broken", "manual"):
+        settings.add_reference(ReferenceConfig(
+            name=doc_id,
+            type="document",
+            url=f"https://cad.onshape.com/documents/d/{doc_id}",
+            local_path=f"./references/{doc_id}",
+            auto_update=doc_id != "manual",
+            last_sync="2026-01-01T00:00:00+00:00",
+            document_id=doc_id,
+        ))
+        settings.update_document_cache(doc_id, doc_id, "", "mv1")
+    return ReferenceManager(settings, tmp_path / "settings.json", tmp_path, client)
+
+
+class TestUpdateReferences:
+    """Tests for ReferenceManager.update_references."""
+
+    def test_check_only_reports_each_reference(self, tmp_path: Path) -> None:
+        client: Any = FakeVersionClient()
+        manager = make_document_manager(tmp_path, client)
+
+        results = manager.update_references(check_only=True)
+
+        assert results == {"same": True, "changed": True, "broken": False, "manual": True}
+        assert sorted(client.checked) == ["broken", "changed", "same"]
+
+    def test_check_messages_follow_their_heading(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = make_document_manager(tmp_path, FakeVersionClient())
+        printed: list[str] = []
+        monkeypatch.setattr(
+            "sync.core.references.console.print", lambda *args, **kwargs: printed.append(
+                " ".join(str(arg) for arg in args)
+            )
+        )
+
+        manager.update_references(check_only=True)
+
+        heading = printed.index("\n[bold blue]Checking reference:[/bold blue] changed")
+        assert "mv1 → mv2" in printed[heading + 1]
+
+    def test_settings_saved_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr("sync.core.references.SyncOperations", FakeSyncOperations)
+        manager = make_document_manager(tmp_path, FakeVersionClient())
+        saves: list[Path] = []
+        monkeypatch.setattr(manager.settings, "save", saves.append)
+
+        results = manager.update_references(force=True)
+
+        assert results == {"same": True, "changed": True, "broken": False, "manual": True}
+        # Only "changed" was synced, and settings were written once at the end
+        assert saves == [tmp_path / "settings.json"]
+        changed = manager._get_reference("changed")
+        assert changed is not None and changed.last_sync != "2026-01-01T00:00:00+00:00"
@@ -1,5 +1,6 @@
 """Tests for sync state tracking."""
 
+import hashlib
 import tempfile
 from pathlib import Path
 
@@ -37,6 +38,22 @@ class TestSyncState:
         finally:
             filepath.unlink()
 
+    def test_hash_file_chunked_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        content = b"x" * (3 * 1024 * 1024 + 17)  # Spans several read chunks
+        with tempfile.NamedTemporaryFile(suffix=".fs", delete=False) as f:
+            f.write(content)
+            filepath = Path(f.name)
+
+        try:
+            expected = hashlib.sha256(content).hexdigest()
+            assert SyncState.hash_file(filepath) == expected
+
+            # Python < 3.11 has no hashlib.file_digest
+            monkeypatch.delattr(hashlib, "file_digest", raising=False)
+            assert SyncState.hash_file(filepath) == expected
+        finally:
+            filepath.unlink()
+
     def test_hash_file_nonexistent(self) -> None:
         result = SyncState.hash_file(Path("/nonexistent/file.txt"))
         assert result is None
@@ -64,6 +81,31 @@ class TestSyncState:
             assert file_state.local_hash == "abc123"
             assert file_state.remote_microversion == "mv456"
 
+    def test_save_skips_when_clean(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / ".sync-state.json"
+            state = SyncState(state_file)
+
+            state.save()
+            assert not state_file.exists()
+
+            state.update_file_state(
+                filepath="test.fs",
+                local_hash="abc123",
+                remote_microversion="mv456",
+                element_id="elem789",
+                document_id="doc000",
+                workspace_id="main",
+            )
+            state.save()
+            assert state_file.exists()
+            assert not state_file.with_suffix(".json.tmp").exists()
+
+            # Nothing changed since the last save -> file is left untouched
+            state_file.write_text("{}")
+            state.save()
+            assert state_file.read_text() == "{}"
+
 
 class TestConflictDetection:
     """Tests for conflict detection logic."""
@@ -114,6 +156,31 @@ class TestConflictDetection:
 
             assert conflict.conflict_type == ConflictType.BOTH_CHANGED
 
+    def test_detect_pull_conflict_remote_unchanged(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / ".sync-state.json"
+            local_file = Path(tmpdir) / "test.fs"
+            local_file.write_text("modified content")
+
+            state = SyncState(state_file)
+            state.update_file_state(
+                filepath="test.fs",
+                local_hash=SyncState.compute_hash("original content"),
+                remote_microversion="mv_same",
+                element_id="elem1",
+                document_id="doc1",
+                workspace_id="main",
+            )
+
+            conflict = state.detect_pull_conflict(
+                filepath="test.fs",
+                local_path=local_file,
+                remote_microversion="mv_same",
+            )
+
+            assert conflict.conflict_type == ConflictType.NONE
+            assert conflict.local_hash is None  # Local file was not hashed
+
     def test_detect_push_conflict_remote_changed(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
             state_file = Path(tmpdir) / ".sync-state.json"
@@ -160,3 +227,33 @@ class TestConflictDetection:
             )
 
             assert conflict.conflict_type == ConflictType.NONE
+
+    def test_detect_pull_conflict_reuses_hash_for_unchanged_file(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / ".sync-state.json"
+            local_file = Path(tmpdir) / "test.fs"
+            local_file.write_text("content")
+
+            state = SyncState(state_file)
+            state.update_file_state(
+                filepath="test.fs",
+                local_hash="cached_hash",
+                remote_microversion="mv_original",
+                element_id="elem1",
+                document_id="doc1",
+                workspace_id="main",
+                local_path=local_file,
+            )
+            state.save()
+
+            # Unchanged stat -> recorded hash is trusted without reading the file
+            file_state = SyncState(state_file).get_file_state("test.fs")
+            assert file_state is not None
+            assert file_state.local_size == len("content")
+            assert SyncState.hash_file(local_file, file_state) == "cached_hash"
+
+            # Changed size -> file is re-hashed
+            local_file.write_text("modified content")
+            assert SyncState.hash_file(local_file, file_state) == SyncState.compute_hash(
+                "modified content"
+            )
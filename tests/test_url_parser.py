@@ -0,0 +1,87 @@
+"""Tests for Onshape URL parsing."""
+
+import pytest
+
+from sync.core.url_parser import (
+    OnshapeUrlParseError,
+    extract_document_info,
+    extract_folder_id,
+    get_url_type,
+    normalize_url,
+    parse_url,
+)
+
+BASE = "https://cad.onshape.com"
+
+
+class TestParseUrl:
+    """Tests for parse_url."""
+
+    def test_element_url(self) -> None:
+        parsed = parse_url(f"{BASE}/documents/d/abc123/w/ws456/e/el789")
+
+        assert parsed._asdict() == {
+            "base_url": BASE,
+            "type": "element",
+            "document_id": "abc123",
+            "workspace_id": "ws456",
+            "element_id": "el789",
+            "folder_id": None,
+        }
+        assert parse_url(f"{BASE}/documents/d/abc123/w/ws456/e/el789") is parsed
+
+    def test_document_and_workspace_urls(self) -> None:
+        assert parse_url(f"{BASE}/documents/d/abc123").type == "document"
+        parsed = parse_url("https://k2-sports.onshape.com/documents/d/abc123/w/ws456?a=1")
+        assert parsed.base_url == "https://k2-sports.onshape.com"
+        assert parsed.type == "document"
+        assert parsed.workspace_id == "ws456"
+        assert parsed.element_id is None
+
+    def test_folder_url(self) -> None:
+        parsed = parse_url(f"{BASE}/documents/folder/fe3ff54b1d12a3a8491215c6")
+
+        assert parsed.type == "folder"
+        assert parsed.folder_id == "fe3ff54b1d12a3a8491215c6"
+        assert parsed.document_id is None
+
+    def test_non_canonical_paths(self) -> None:
+        # Version URLs and extra segments fall back to pattern matching
+        parsed = parse_url(f"{BASE}/documents/d/abc/v/ver1/e/el789")
+        assert parsed.type == "element"
+        assert parsed.workspace_id is None
+        assert parsed.element_id == "el789"
+        assert parse_url(f"{BASE}/documents/d/abc.def").document_id == "abc"
+
+    @pytest.mark.parametrize("url", ["not a url", f"{BASE}/documents", f"{BASE}/other/d/x"])
+    def test_invalid_urls(self, url: str) -> None:
+        with pytest.raises(OnshapeUrlParseError):
+            parse_url(url)
+
+
+class TestHelpers:
+    """Tests for the helpers built on parse_url."""
+
+    def test_get_url_type(self) -> None:
+        assert get_url_type(f"{BASE}/documents/d/abc/w/ws/e/el") == "element"
+        assert get_url_type(f"{BASE}/documents/folder/f1") == "folder"
+
+    def test_extract_ids(self) -> None:
+        assert extract_document_info(f"{BASE}/documents/d/abc/w/ws") == ("abc", "ws")
+        assert extract_folder_id(f"{BASE}/documents/folder/f1") == "f1"
+        with pytest.raises(OnshapeUrlParseError):
+            extract_folder_id(f"{BASE}/documents/d/abc")
+
+    def test_normalize_url(self) -> None:
+        assert normalize_url(f"{BASE}/documents/d/abc/w/ws/e/el?configuration=x") == (
+            f"{BASE}/documents/d/abc/w/ws/e/el"
+        )
+        assert normalize_url(f"{BASE}/documents/folder/f1/") == f"{BASE}/documents/folder/f1"
+        assert normalize_url(f"{BASE}/documents/d/abc/v/ver1/e/el") == f"{BASE}/documents/d/abc"
+        assert normalize_url("HTTPS://cad.onshape.com/documents/d/abc") == f"{BASE}/documents/d/abc"
+
+    def test_normalize_canonical_url_unchanged(self) -> None:
+        url = f"{BASE}/documents/d/abc/w/ws/e/el"
+        assert normalize_url(url) is url
+        with pytest.raises(OnshapeUrlParseError):
+            normalize_url("not a url")